@@ -0,0 +1,121 @@
+//! Native walk-and-filter kernel for the file scraper.
+//!
+//! `scan_and_filter` walks the given roots and applies the same rules as the Python
+//! pipeline in `src/main.py` (extension whitelist, ignored prefixes, AppData / recycle
+//! bin, optional downloads folder and per-folder skip globs), returning only the final
+//! `(path, scan_mode)` results. Build it with `maturin develop -m scraper_fast/Cargo.toml`.
+
+use std::collections::HashSet;
+
+use glob::{MatchOptions, Pattern};
+use pyo3::prelude::*;
+use rayon::prelude::*;
+use walkdir::WalkDir;
+
+const GLOB_OPTIONS: MatchOptions = MatchOptions {
+    case_sensitive: false,
+    require_literal_separator: true,
+    require_literal_leading_dot: false,
+};
+
+struct Filter {
+    exts: HashSet<String>,
+    ignore_prefixes: Vec<String>,
+    skip_globs: Vec<Pattern>,
+    ignore_downloads: bool,
+}
+
+impl Filter {
+    fn wants_extension(&self, name: &str) -> bool {
+        match name.rfind('.') {
+            Some(dot) => self.exts.contains(&name[dot..].to_lowercase()),
+            None => false,
+        }
+    }
+
+    /// Check a lowercased path against every exclusion rule.
+    ///
+    /// Directories are passed with a trailing separator so their last component is
+    /// treated as a folder, which lets the walker prune whole subtrees.
+    fn is_excluded(&self, lower: &str) -> bool {
+        if self.ignore_prefixes.iter().any(|p| lower.starts_with(p.as_str())) {
+            return true;
+        }
+        if lower.contains("appdata") || lower.contains("$recycle.bin") {
+            return true;
+        }
+        if self.ignore_downloads && lower.contains("\\downloads\\") {
+            return true;
+        }
+        if self.skip_globs.is_empty() {
+            return false;
+        }
+        // Like the folder rule in main._ignore_expressions, the first component (the drive)
+        // is never matched.
+        lower
+            .split(|c| c == '\\' || c == '/')
+            .skip(1)
+            .filter(|part| !part.is_empty())
+            .any(|part| self.skip_globs.iter().any(|g| g.matches_with(part, GLOB_OPTIONS)))
+    }
+}
+
+fn walk_root(root: &str, filter: &Filter, scan_mode: &str) -> Vec<(String, String)> {
+    let mut out = Vec::new();
+    let walker = WalkDir::new(root).into_iter().filter_entry(|entry| {
+        if entry.depth() == 0 || !entry.file_type().is_dir() {
+            return true;
+        }
+        let mut lower = entry.path().to_string_lossy().to_lowercase();
+        lower.push('\\');
+        !filter.is_excluded(&lower)
+    });
+    // Entries that cannot be read (e.g. permission denied) are skipped.
+    for entry in walker.filter_map(Result::ok) {
+        if !entry.file_type().is_file() || !filter.wants_extension(&entry.file_name().to_string_lossy()) {
+            continue;
+        }
+        let path = entry.path().to_string_lossy().into_owned();
+        if filter.is_excluded(&path.to_lowercase()) {
+            continue;
+        }
+        out.push((path, scan_mode.to_owned()));
+    }
+    out
+}
+
+/// Walk the roots in parallel and return the `(path, scan_mode)` pairs that pass every filter.
+#[pyfunction]
+fn scan_and_filter(
+    py: Python<'_>,
+    roots: Vec<String>,
+    exts: Vec<String>,
+    ignore_prefixes: Vec<String>,
+    skip_globs: Vec<String>,
+    ignore_downloads: bool,
+    scan_mode: String,
+) -> Vec<(String, String)> {
+    let filter = Filter {
+        exts: exts.iter().map(|e| e.to_lowercase()).collect(),
+        ignore_prefixes: ignore_prefixes.iter().map(|p| p.to_lowercase()).collect(),
+        // Malformed globs (e.g. an unclosed "[") are matched literally, as in Python.
+        skip_globs: skip_globs
+            .iter()
+            .filter(|g| !g.is_empty())
+            .map(|g| Pattern::new(g).unwrap_or_else(|_| Pattern::new(&Pattern::escape(g)).unwrap()))
+            .collect(),
+        ignore_downloads,
+    };
+    py.allow_threads(|| {
+        roots
+            .par_iter()
+            .flat_map_iter(|root| walk_root(root, &filter, &scan_mode))
+            .collect()
+    })
+}
+
+#[pymodule]
+fn scraper_fast(_py: Python<'_>, m: &PyModule) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(scan_and_filter, m)?)?;
+    Ok(())
+}
@@ -5,7 +5,30 @@ import time
 import json
 import os
 import winreg
-import fnmatch
+import functools
+import itertools
+import re
+import sys
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+
+try:
+    import hyperscan
+except ImportError:
+    # Fall back to Python's re module when the Hyperscan binding is not installed.
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard json module when orjson is not installed.
+    orjson = None
+
+try:
+    import scraper_fast
+except ImportError:
+    # Fall back to the Python walker and filters when the Rust extension is not built.
+    scraper_fast = None
 
 from ui import (
     create_ui,
@@ -16,23 +39,70 @@ from ui import (
     enable_backup_button,
     format_elapsed_time  # Added to imports
 )
-from scraper import FileScraper
+from scraper import FileScraper, split_skip_patterns
+
+
+@dataclass
+class FileIndex:
+    """
+    Snapshot of every file found below a set of root directories.
+    """
+    files: list[str]
+    built_at: float
+    roots: tuple[str, ...]
+
 
 # Global storage for indexed files and folders.
-INDEXED_FILES = []
+INDEXED_FILES: Optional[FileIndex] = None
 INDEXED_FOLDERS = []
+# Set once initial indexing has finished, successfully or not.
+INDEX_READY = threading.Event()
+# Number of seconds during which scans reuse the initial index instead of walking the disk.
+INDEX_MAX_AGE = 300
+
+# Number of accepted results between updates of the file count and current file labels.
+RESULT_UI_BATCH = 256
+
+# System directories whose contents are never reported.
+IGNORE_DIRS = [
+    "C:\\Windows",
+    "C:\\Program Files",
+    "C:\\Program Files (x86)",
+    "C:\\ProgramData",
+    "C:\\$Recycle.Bin",
+    "C:\\msys64",
+    "C:\\vcpkg"
+]
+
+# Lowercase prefixes of ignored system directories, used to prune the walk.
+IGNORE_PREFIXES = tuple(d.lower() for d in IGNORE_DIRS)
+
+# Ignored system directory prefixes plus AppData and recycle bin folders anywhere in a path,
+# written against the lowercased path.
+_IGNORE_PATTERN = (
+    "^(?:" + "|".join(re.escape(d) for d in IGNORE_PREFIXES) + ")"
+    + r"|appdata|\$recycle\.bin"
+)
 
+# File extensions collected by each scan mode.
+_EXT_SETS = {
+    "text": frozenset({".txt", ".asc"}),
+    "image": frozenset({".png", ".jpg", ".jpeg", ".gif"}),
+    "video": frozenset({".mp4", ".avi", ".mkv"}),
+    "full": frozenset({".txt", ".asc", ".png", ".jpg", ".jpeg", ".gif", ".mp4", ".avi", ".mkv", ".mp3"}),
+}
 
-def safe_update_status(root: tk.Tk, status_label: tk.Label, message: str) -> None:
+
+def safe_update_status(root: tk.Tk, status_var: tk.StringVar, message: str) -> None:
     """
     Safely update the status label in the UI using the main thread.
     
     Parameters:
         root: The main Tkinter window.
-        status_label: The label widget to update.
+        status_var: The status text variable to update.
         message: The message to display.
     """
-    root.after(0, lambda: update_status(status_label, message))
+    root.after(0, lambda: update_status(status_var, message))
 
 
 def safe_update_progress(root: tk.Tk, progress: ttk.Progressbar, value: int) -> None:
@@ -47,33 +117,36 @@ def safe_update_progress(root: tk.Tk, progress: ttk.Progressbar, value: int) ->
     root.after(0, lambda: update_progress(progress, value))
 
 
-def is_ignored_file(file_path: str, file_type: str) -> bool:
+@functools.lru_cache(maxsize=1)
+def _profile_list() -> tuple[tuple[str, str], ...]:
     """
-    Determine whether a file should be ignored based on its path.
+    Read the user profiles under C:\\Users from the Windows registry ProfileList key.
     
-    Parameters:
-        file_path: The full path of the file.
-        file_type: The type of scan (e.g., 'text', 'image', 'video', etc.).
+    The result is cached for the lifetime of the process; call _profile_list.cache_clear()
+    to force the registry to be read again.
     
     Returns:
-        True if the file should be ignored, False otherwise.
-    """
-    ignore_dirs = [
-        "C:\\Windows",
-        "C:\\Program Files",
-        "C:\\Program Files (x86)",
-        "C:\\ProgramData",
-        "C:\\$Recycle.Bin",
-        "C:\\msys64",
-        "C:\\vcpkg"
-    ]
-    file_path_lower = file_path.lower()
-    for ignore in ignore_dirs:
-        if file_path.startswith(ignore):
-            return True
-    if "appdata" in file_path_lower or "$recycle.bin" in file_path_lower:
-        return True
-    return False
+        A tuple of (user_name, profile_path) pairs.
+    """
+    profiles = []
+    try:
+        with winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE,
+            r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\ProfileList"
+        ) as key:
+            num_subkeys = winreg.QueryInfoKey(key)[0]
+            for i in range(num_subkeys):
+                subkey_name = winreg.EnumKey(key, i)
+                with winreg.OpenKey(key, subkey_name) as subkey:
+                    try:
+                        profile_path, _ = winreg.QueryValueEx(subkey, "ProfileImagePath")
+                    except FileNotFoundError:
+                        continue
+                if profile_path.lower().startswith("c:\\users") and os.path.isdir(profile_path):
+                    profiles.append((os.path.basename(profile_path), profile_path))
+    except Exception:
+        pass
+    return tuple(profiles)
 
 
 def get_all_user_profiles() -> dict[str, str]:
@@ -83,27 +156,7 @@ def get_all_user_profiles() -> dict[str, str]:
     Returns:
         A dictionary mapping usernames to their profile paths.
     """
-    all_users = {}
-    try:
-        key = winreg.OpenKey(
-            winreg.HKEY_LOCAL_MACHINE,
-            r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\ProfileList"
-        )
-        num_subkeys = winreg.QueryInfoKey(key)[0]
-        for i in range(num_subkeys):
-            subkey_name = winreg.EnumKey(key, i)
-            subkey = winreg.OpenKey(key, subkey_name)
-            try:
-                profile_path, _ = winreg.QueryValueEx(subkey, "ProfileImagePath")
-                if profile_path.lower().startswith("c:\\users") and os.path.isdir(profile_path):
-                    user_name = os.path.basename(profile_path)
-                    all_users[user_name] = profile_path
-            except FileNotFoundError:
-                continue
-        winreg.CloseKey(key)
-    except Exception:
-        pass
-    return all_users
+    return dict(_profile_list())
 
 
 def get_all_user_directories() -> list[str]:
@@ -113,132 +166,266 @@ def get_all_user_directories() -> list[str]:
     Returns:
         A list of user directory paths.
     """
-    user_dirs = []
-    try:
-        key = winreg.OpenKey(
-            winreg.HKEY_LOCAL_MACHINE,
-            r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\ProfileList"
-        )
-        num_subkeys = winreg.QueryInfoKey(key)[0]
-        for i in range(num_subkeys):
-            subkey_name = winreg.EnumKey(key, i)
-            subkey = winreg.OpenKey(key, subkey_name)
-            try:
-                profile_path, _ = winreg.QueryValueEx(subkey, "ProfileImagePath")
-                if profile_path.lower().startswith("c:\\users") and os.path.isdir(profile_path):
-                    user_dirs.append(profile_path)
-            except FileNotFoundError:
-                continue
-        winreg.CloseKey(key)
-    except Exception:
-        pass
-    return user_dirs
+    return [profile_path for _, profile_path in _profile_list()]
 
 
-def get_files_by_scan_mode(all_files: list[str], scan_mode: str) -> list[str]:
+def get_files_by_scan_mode(all_files: Iterable[str], scan_mode: str) -> Iterator[str]:
     """
-    Filter a list of files based on the specified scan mode.
+    Lazily filter files based on the specified scan mode.
     
     Parameters:
-        all_files: List of file paths.
+        all_files: File paths to filter.
         scan_mode: One of "text", "image", "video", or "full".
     
     Returns:
-        A list of file paths that match the scan mode criteria.
+        An iterator over the file paths that match the scan mode criteria.
     """
-    if scan_mode == "text":
-        return [f for f in all_files if f.lower().endswith('.txt') or f.lower().endswith('.asc')]
-    elif scan_mode == "image":
-        return [f for f in all_files if any(f.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif'])]
-    elif scan_mode == "video":
-        return [f for f in all_files if any(f.lower().endswith(ext) for ext in ['.mp4', '.avi', '.mkv'])]
-    else:  # full scan
-        desired_extensions = ['.txt', '.asc', '.png', '.jpg', '.jpeg', '.gif', '.mp4', '.avi', '.mkv', '.mp3']
-        return [f for f in all_files if f.endswith(tuple(desired_extensions))]
+    exts = _EXT_SETS.get(scan_mode, _EXT_SETS["full"])
+
+    def has_wanted_extension(f: str) -> bool:
+        # Only the text after the last dot of the file name is lowercased and looked up;
+        # paths without a dot in their final component are rejected up front.
+        dot = f.rfind(".")
+        return dot > f.rfind("\\") and f[dot:].lower() in exts
+
+    return filter(has_wanted_extension, all_files)
 
 
-def is_downloads(file_path: str) -> bool:
+def _glob_to_regex(pattern: str) -> str:
     """
-    Check if the file is located in a downloads directory.
+    Translate a folder glob into a regex fragment that matches within a single path component.
+    
+    Unlike fnmatch.translate, wildcards never match a path separator, so the fragment can be
+    embedded in a regex applied to the whole path.
     
     Parameters:
-        file_path: The full file path.
+        pattern: The glob pattern (supports *, ? and [...] sets).
     
     Returns:
-        True if the file is in a downloads directory, False otherwise.
+        The regex source for the pattern.
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == "*":
+            out.append(r"[^\\/]*")
+        elif c == "?":
+            out.append(r"[^\\/]")
+        elif c == "[":
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(r"\[")
+            else:
+                body = pattern[i:j].replace("\\", "\\\\")
+                i = j + 1
+                if body.startswith("!"):
+                    # A negated set must not match a separator either. The separators go
+                    # first, so a leading "]" or "-" is escaped to stay a literal.
+                    body = body[1:]
+                    if body[:1] in ("]", "-"):
+                        body = "\\" + body
+                    body = r"^\\/" + body
+                elif body.startswith("^"):
+                    body = "\\" + body
+                out.append(f"[{body}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _ignore_expressions(skip_patterns: list[str], ignore_downloads: bool) -> list[str]:
     """
-    normalized = os.path.normpath(file_path).lower()
-    return os.path.sep + "downloads" + os.path.sep in normalized
+    Build the regex sources for every path-based exclusion rule.
+    
+    The expressions cover the ignored system directories, AppData and recycle bin folders,
+    the optional downloads folder, the user's skip patterns and blocked folders. They are
+    meant to be searched against the lowercased file path.
+    
+    Parameters:
+        skip_patterns: A list of folder patterns to skip.
+        ignore_downloads: Whether files in a downloads directory should be excluded.
+    
+    Returns:
+        A list of regex sources.
+    """
+    expressions = [_IGNORE_PATTERN]
+    if ignore_downloads:
+        expressions.append(r"\\downloads\\")
+    names, globs, blocked = split_skip_patterns(skip_patterns)
+    folders = [_glob_to_regex(p) for p in sorted(names)] + [_glob_to_regex(p.lower()) for p in globs]
+    if folders:
+        expressions.append(r"\\(?:" + "|".join(folders) + r")(?:\\|$)")
+    if blocked:
+        expressions.append("^(?:" + "|".join(re.escape(b) for b in sorted(blocked)) + r")\\")
+    return expressions
+
+
+def compile_ignore_regex(skip_patterns: list[str], ignore_downloads: bool) -> re.Pattern:
+    """
+    Build a single regex covering every path-based exclusion rule.
+    
+    Parameters:
+        skip_patterns: A list of folder patterns to skip.
+        ignore_downloads: Whether files in a downloads directory should be excluded.
+    
+    Returns:
+        The compiled regex, to be searched against the lowercased file path.
+    """
+    return re.compile("|".join(_ignore_expressions(skip_patterns, ignore_downloads)))
 
 
-def has_skip_folder(file_path: str, skip_patterns: list[str]) -> bool:
+def compile_ignore_matcher(skip_patterns: list[str], ignore_downloads: bool) -> Callable[[str], bool]:
     """
-    Check if any folder in the file path matches a skip pattern.
+    Build a predicate that reports whether a file path is excluded by any rule.
+    
+    When the Hyperscan binding is available all rules are compiled into one multi-pattern
+    database that is scanned once per path; otherwise the unioned Python regex is used.
+    Both search the lowercased path, and paths that are not valid UTF-8 (file names with
+    lone surrogates) always go through the Python regex.
     
     Parameters:
-        file_path: The full file path.
         skip_patterns: A list of folder patterns to skip.
+        ignore_downloads: Whether files in a downloads directory should be excluded.
     
     Returns:
-        True if any folder in the path matches a skip pattern, False otherwise.
+        A function taking a file path and returning True if the file should be skipped.
     """
-    parts = os.path.normpath(file_path).split(os.path.sep)
-    return any(
-        fnmatch.fnmatchcase(part.lower(), pattern.lower())
-        for part in parts[1:]
-        for pattern in skip_patterns if pattern
+    search = compile_ignore_regex(skip_patterns, ignore_downloads).search
+    if hyperscan is None:
+        return lambda file_path: search(file_path.lower()) is not None
+
+    expressions = [e.encode("utf-8") for e in _ignore_expressions(skip_patterns, ignore_downloads)]
+    # The rules are written in lowercase and matched against the lowercased path, exactly
+    # like the Python regex, so Hyperscan's own case folding is not used.
+    flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+    db = hyperscan.Database()
+    db.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[flags] * len(expressions)
     )
+    # The scratch space is only used by the thread running the scan.
+    scratch = hyperscan.Scratch(db)
+
+    def on_match(*_) -> bool:
+        # Returning True stops the scan at the first match.
+        return True
+
+    def is_excluded(file_path: str) -> bool:
+        lower = file_path.lower()
+        try:
+            data = lower.encode("utf-8")
+        except UnicodeEncodeError:
+            # Invalid UTF-8 must not be scanned under HS_FLAG_UTF8.
+            return search(lower) is not None
+        try:
+            db.scan(data, match_event_handler=on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+    return is_excluded
 
 
-def apply_additional_filters(files: list[str], scan_mode: str, settings: dict) -> list[dict]:
+def iter_filtered(files: Iterable[str], scan_mode: str, settings: dict) -> Iterator[tuple[str, str]]:
     """
-    Apply additional filtering to the list of files based on settings.
+    Lazily apply additional filtering to the files based on settings.
     
     Parameters:
-        files: List of file paths to filter.
+        files: File paths to filter.
         scan_mode: The scan mode used (e.g., 'text', 'image', 'video', or 'full').
         settings: A dictionary of settings that may include skip patterns and a downloads ignore flag.
     
-    Returns:
-        A list of dictionaries containing file information that passed the filters.
+    Yields:
+        A (path, scan_mode) tuple for each file that passed the filters.
     """
     skip_patterns = settings.get("skip_folders", [])
-    filtered_files = []
+    ignore_downloads = settings.get("ignore_downloads", tk.BooleanVar()).get()
+    is_excluded = compile_ignore_matcher(skip_patterns, ignore_downloads)
+    # Every result shares the same interned scan mode string.
+    scan_mode = sys.intern(scan_mode)
     for f in files:
-        if is_ignored_file(f, scan_mode):
-            continue
-        # If the "ignore_downloads" setting is enabled.
-        if settings.get("ignore_downloads", tk.BooleanVar()).get() and is_downloads(f):
+        # Normalize any forward slashes once so every rule can assume backslashes.
+        if "/" in f:
+            f = f.replace("/", "\\")
+        if is_excluded(f):
             continue
-        if skip_patterns and has_skip_folder(f, skip_patterns):
-            continue
-        filtered_files.append({
-            "path": f,
-            "name": os.path.basename(f),
-            "type": scan_mode
-        })
-    return filtered_files
+        yield f, scan_mode
+
+
+def result_record(path: str, scan_mode: str) -> dict:
+    """
+    Build the JSON record for a scan result.
+    
+    Parameters:
+        path: The full file path.
+        scan_mode: The scan mode that found the file.
+    
+    Returns:
+        A dictionary with the file's path, name and type.
+    """
+    return {"path": path, "name": path[path.rfind("\\") + 1:], "type": scan_mode}
 
 
-def save_results(results: list[dict], filename: str) -> None:
+def write_result_line(results_file: BinaryIO, result: tuple[str, str]) -> None:
+    """
+    Append a single scan result to a JSON Lines file.
+    
+    Parameters:
+        results_file: A file opened in binary write mode.
+        result: The (path, scan_mode) tuple to write.
     """
-    Save the scan results to a JSON file.
+    record = result_record(*result)
+    if orjson is not None:
+        try:
+            results_file.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            return
+        except orjson.JSONEncodeError:
+            # Windows file names may hold lone surrogates, which orjson rejects; the
+            # standard encoder escapes them instead.
+            pass
+    results_file.write(json.dumps(record).encode("utf-8") + b"\n")
+
+
+def get_indexed_files(roots: list[str]) -> Optional[list[str]]:
+    """
+    Return the indexed files below the given roots if the index is fresh enough to reuse.
     
     Parameters:
-        results: The list of file dictionaries.
-        filename: The name of the file to save the results.
+        roots: The directories the caller is about to scan.
+    
+    Returns:
+        The indexed file paths below the roots, or None if the index is missing, stale,
+        or does not cover every root.
     """
-    with open(filename, "w", encoding="utf-8") as json_file:
-        json.dump(results, json_file, indent=2)
+    index = INDEXED_FILES
+    if index is None or time.time() - index.built_at >= INDEX_MAX_AGE:
+        return None
+    wanted, indexed = set(roots), set(index.roots)
+    if not wanted <= indexed:
+        return None
+    if wanted == indexed:
+        return index.files
+    prefixes = tuple(r.rstrip("\\") + "\\" for r in roots)
+    return [f for f in index.files if f.startswith(prefixes)]
 
 
 def run_scraper(
     scraper: FileScraper,
     root: tk.Tk,
     progress: ttk.Progressbar,
-    status_label: tk.Label,
-    total_files_label: tk.Label,
-    current_file_label: tk.Label,
+    status_var: tk.StringVar,
+    total_files_var: tk.StringVar,
+    current_file_var: tk.StringVar,
     settings: dict,
     scan_mode: str,
     backup_btn: tk.Button
@@ -250,15 +437,15 @@ def run_scraper(
         scraper: An instance of FileScraper to perform the scanning.
         root: The main Tkinter window.
         progress: The progress bar widget.
-        status_label: The label widget for status updates.
-        total_files_label: Label for displaying the total file count (unused in current logic).
-        current_file_label: Label for displaying the currently scanned file (unused in current logic).
+        status_var: The text variable for status updates.
+        total_files_var: Text variable for displaying the number of files found so far.
+        current_file_var: Text variable for displaying the most recently found file.
         settings: Dictionary of settings from the UI.
         scan_mode: The mode of scan ("text", "image", "video", or "full").
         backup_btn: The backup button widget to enable after scanning.
     """
     start_time = time.time()
-    safe_update_status(root, status_label, "Preparing scan directories...")
+    safe_update_status(root, status_var, "Preparing scan directories...")
 
     # Retrieve user directories based on settings.
     all_users = get_all_user_profiles()
@@ -274,25 +461,71 @@ def run_scraper(
     if os.path.isdir("C:\\arche"):
         user_dirs.append("C:\\arche")
 
-    all_files = scraper.scan_all_files(user_dirs)
-    safe_update_progress(root, progress, 25)
+    # Reuse the initial index when it covers these directories; wait for it first so
+    # the same trees are not walked twice at startup.
+    if not INDEX_READY.is_set():
+        safe_update_status(root, status_var, "Waiting for initial indexing...")
+        INDEX_READY.wait()
+    all_files = get_indexed_files(user_dirs)
+    exts = _EXT_SETS.get(scan_mode, _EXT_SETS["full"])
+    skip_names, skip_globs, blocked = split_skip_patterns(settings.get("skip_folders", []))
+    if all_files is None and scraper_fast is not None:
+        # The native kernel walks and applies every filter, returning final results.
+        # Blocked folders are handed over as prefixes; it matches names and globs per folder.
+        results = scraper_fast.scan_and_filter(
+            user_dirs,
+            sorted(exts),
+            list(IGNORE_PREFIXES) + [b + "\\" for b in sorted(blocked)],
+            sorted(skip_names) + skip_globs,
+            bool(settings.get("ignore_downloads", tk.BooleanVar()).get()),
+            scan_mode
+        )
+        safe_update_progress(root, progress, 50)
+    elif all_files is None:
+        # Only files with an extension of interest are collected by the walker, and
+        # skipped or blocked folders are never descended into. Each chunk is filtered and
+        # logged while the rest of the trees are still being walked.
+        safe_update_status(root, status_var, f"Scanning for {scan_mode} files...")
+        safe_update_progress(root, progress, 25)
+        chunks = scraper.iter_scan(
+            user_dirs,
+            ext_whitelist=exts,
+            ignore_prefixes=IGNORE_PREFIXES,
+            skip_names=skip_names,
+            skip_globs=skip_globs,
+            blocked_abs=blocked
+        )
+        results = iter_filtered(itertools.chain.from_iterable(chunks), scan_mode, settings)
+    else:
+        safe_update_progress(root, progress, 25)
 
-    # Filter files based on scan mode.
-    files_to_scan = get_files_by_scan_mode(all_files, scan_mode)
-    safe_update_status(root, status_label, f"Found {len(files_to_scan)} files for {scan_mode} scan.")
-    safe_update_progress(root, progress, 50)
+        safe_update_status(root, status_var, f"Filtering {len(all_files)} files for {scan_mode} scan...")
+        safe_update_progress(root, progress, 50)
 
-    # Apply additional filters.
-    filtered_files = apply_additional_filters(files_to_scan, scan_mode, settings)
+        # Filter by scan mode and settings in one fused, lazy pass.
+        results = iter_filtered(get_files_by_scan_mode(all_files, scan_mode), scan_mode, settings)
 
-    # Save results to a JSON file.
-    save_results(filtered_files, "results.json")
+    # Stream each accepted file to a JSON Lines log. The (path, type) tuples are kept in
+    # memory only because the backup step needs them.
+    filtered_files = []
+    with open("results.jsonl", "wb") as results_file:
+        for result in results:
+            write_result_line(results_file, result)
+            filtered_files.append(result)
+            # Post the labels once per batch rather than once per file.
+            if len(filtered_files) % RESULT_UI_BATCH == 0:
+                root.after(0, update_total_files, total_files_var, len(filtered_files))
+                root.after(0, update_current_file, current_file_var, result[0])
+    root.after(0, update_total_files, total_files_var, len(filtered_files))
+    if filtered_files:
+        root.after(0, update_current_file, current_file_var, filtered_files[-1][0], True)
 
     elapsed = time.time() - start_time
     safe_update_status(
         root,
-        status_label,
-        f"{scan_mode.capitalize()} scan complete! ({format_elapsed_time(elapsed)})\nResults logged to results.json"
+        status_var,
+        f"{scan_mode.capitalize()} scan complete! Found {len(filtered_files)} files "
+        f"({format_elapsed_time(elapsed)})\nResults logged to results.jsonl"
     )
     safe_update_progress(root, progress, 100)
 
@@ -300,35 +533,39 @@ def run_scraper(
     root.after(0, lambda: enable_backup_button(backup_btn, filtered_files))
 
 
-def initial_index(scraper: FileScraper, root: tk.Tk, status_label: tk.Label, settings: dict) -> None:
+def initial_index(scraper: FileScraper, root: tk.Tk, status_var: tk.StringVar, settings: dict) -> None:
     """
     Perform initial indexing of files to prepare folder information for later use.
     
     Parameters:
         scraper: An instance of FileScraper to perform the indexing.
         root: The main Tkinter window.
-        status_label: The label widget for status updates.
+        status_var: The text variable for status updates.
         settings: Dictionary of settings from the UI.
     """
-    user_dirs = get_all_user_directories()
-    if os.path.isdir("C:\\arche"):
-        user_dirs.append("C:\\arche")
-    files = scraper.scan_all_files(user_dirs)
     global INDEXED_FILES, INDEXED_FOLDERS
-    INDEXED_FILES = files
+    try:
+        user_dirs = get_all_user_directories()
+        if os.path.isdir("C:\\arche"):
+            user_dirs.append("C:\\arche")
+        files = scraper.scan_all_files(user_dirs)
+        INDEXED_FILES = FileIndex(files=files, built_at=time.time(), roots=tuple(user_dirs))
+    finally:
+        # Unblock waiting scans even if indexing failed; they fall back to walking the disk.
+        INDEX_READY.set()
     INDEXED_FOLDERS = sorted({os.path.dirname(f) for f in files})
     # Store indexed folders in settings for use elsewhere.
     settings["indexed_folders"] = INDEXED_FOLDERS
-    safe_update_status(root, status_label, f"Initial indexing complete: {len(INDEXED_FOLDERS)} folders found.")
+    safe_update_status(root, status_var, f"Initial indexing complete: {len(INDEXED_FOLDERS)} folders found.")
 
 
 def start_scan_thread(
     scraper: FileScraper,
     root: tk.Tk,
     progress: ttk.Progressbar,
-    status_label: tk.Label,
-    total_files_label: tk.Label,
-    current_file_label: tk.Label,
+    status_var: tk.StringVar,
+    total_files_var: tk.StringVar,
+    current_file_var: tk.StringVar,
     settings: dict,
     scan_mode: str,
     backup_btn: tk.Button
@@ -340,9 +577,9 @@ def start_scan_thread(
         scraper: An instance of FileScraper.
         root: The main Tkinter window.
         progress: The progress bar widget.
-        status_label: The label widget for status updates.
-        total_files_label: Label for total files (unused).
-        current_file_label: Label for current file (unused).
+        status_var: The text variable for status updates.
+        total_files_var: Text variable for total files (unused).
+        current_file_var: Text variable for current file (unused).
         settings: Dictionary of settings from the UI.
         scan_mode: The scan mode to execute.
         backup_btn: The backup button widget to enable after scanning.
@@ -353,9 +590,9 @@ def start_scan_thread(
             scraper,
             root,
             progress,
-            status_label,
-            total_files_label,
-            current_file_label,
+            status_var,
+            total_files_var,
+            current_file_var,
             settings,
             scan_mode,
             backup_btn
@@ -369,40 +606,40 @@ def main() -> None:
     Initialize the UI and start the application.
     """
     # Create the UI components.
-    (root, progress, status_label, total_files_label, current_file_label,
+    (root, progress, status_var, total_files_var, current_file_var,
      settings, btn_text, btn_image, btn_video, btn_full, backup_btn) = create_ui()
     scraper = FileScraper()
 
     # Start initial indexing in a separate thread.
     threading.Thread(
         target=initial_index,
-        args=(scraper, root, status_label, settings),
+        args=(scraper, root, status_var, settings),
         daemon=True
     ).start()
 
     # Bind button commands to start scans.
     btn_text.config(
         command=lambda: start_scan_thread(
-            scraper, root, progress, status_label, total_files_label,
-            current_file_label, settings, "text", backup_btn
+            scraper, root, progress, status_var, total_files_var,
+            current_file_var, settings, "text", backup_btn
         )
     )
     btn_image.config(
         command=lambda: start_scan_thread(
-            scraper, root, progress, status_label, total_files_label,
-            current_file_label, settings, "image", backup_btn
+            scraper, root, progress, status_var, total_files_var,
+            current_file_var, settings, "image", backup_btn
         )
     )
     btn_video.config(
         command=lambda: start_scan_thread(
-            scraper, root, progress, status_label, total_files_label,
-            current_file_label, settings, "video", backup_btn
+            scraper, root, progress, status_var, total_files_var,
+            current_file_var, settings, "video", backup_btn
         )
     )
     btn_full.config(
         command=lambda: start_scan_thread(
-            scraper, root, progress, status_label, total_files_label,
-            current_file_label, settings, "full", backup_btn
+            scraper, root, progress, status_var, total_files_var,
+            current_file_var, settings, "full", backup_btn
         )
     )
 
@@ -1,10 +1,725 @@
 import os
+import ctypes
 import fnmatch
-from concurrent.futures import ThreadPoolExecutor
-import winreg
-from typing import Callable, Optional, List
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Deque, FrozenSet, Iterable, Iterator, Optional, List, Tuple, Union
+import sys
 import threading
-from queue import Queue, Empty
+import itertools
+import queue
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+try:
+    from scraper_native import walk_tree as _native_walk_tree
+except ImportError:
+    # Fall back to the os.scandir worker pool when the extension is not built.
+    _native_walk_tree = None
+
+# Lowercase folder names whose subtrees never hold reportable files; they are not descended into.
+PRUNED_DIR_NAMES = frozenset({"appdata", "$recycle.bin"})
+
+# The Python walkers classify entries from the directory record itself (follow_symlinks=False
+# or the raw FindFirstFileExW attributes) so the type never costs an extra stat. Name-surrogate
+# reparse points (symbolic links and junctions) are therefore intentionally skipped rather than
+# resolved, and no walker descends into a linked directory. Other reparse points, such as
+# OneDrive Files On-Demand placeholders, are ordinary files and folders.
+
+# On CPython 3.13+ for Windows, os.walk sits on the faster NtQueryDirectoryFile-based
+# scandir backend and outperforms the hand-rolled thread pool for local disks.
+_PREFER_OS_WALK = sys.platform == "win32" and sys.version_info >= (3, 13)
+
+
+# An idle worker that fails this many steals in a row sleeps briefly between attempts.
+_STEAL_ATTEMPTS_BEFORE_BACKOFF = 8
+_STEAL_BACKOFF_SECONDS = 0.001
+
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _FindFirstFileExW = _kernel32.FindFirstFileExW
+    _FindFirstFileExW.argtypes = [
+        wintypes.LPCWSTR, ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD
+    ]
+    _FindFirstFileExW.restype = wintypes.HANDLE
+    _FindNextFileW = _kernel32.FindNextFileW
+    _FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    _FindNextFileW.restype = wintypes.BOOL
+    _FindClose = _kernel32.FindClose
+    _FindClose.argtypes = [wintypes.HANDLE]
+    _FindClose.restype = wintypes.BOOL
+
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+_FIND_EX_INFO_BASIC = 1
+_FIND_EX_SEARCH_NAME_MATCH = 0
+_FIND_FIRST_EX_LARGE_FETCH = 2
+_ERROR_FILE_NOT_FOUND = 2
+_FILE_ATTRIBUTE_DIRECTORY = 0x10
+_FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+_IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003
+_IO_REPARSE_TAG_SYMLINK = 0xA000000C
+# Reparse tags with this bit set redirect to another name (links, junctions, app exec links).
+_IO_REPARSE_TAG_NAME_SURROGATE = 0x20000000
+
+
+def _is_name_surrogate(tag: int) -> bool:
+    """
+    Check whether a reparse tag makes its entry a link to another path.
+
+    Parameters:
+        tag: The reparse tag of the entry.
+
+    Returns:
+        True for symbolic links, junctions and other name surrogates; False otherwise.
+    """
+    return (tag == _IO_REPARSE_TAG_SYMLINK or tag == _IO_REPARSE_TAG_MOUNT_POINT
+            or bool(tag & _IO_REPARSE_TAG_NAME_SURROGATE))
+
+
+def _scandir_win(path: str) -> Iterator[Tuple[str, bool, bool]]:
+    """
+    List a directory with FindFirstFileExW using the large-fetch buffer.
+
+    Only names, attribute bits and reparse tags are read, never a stat. Name-surrogate
+    reparse points (symbolic links and junctions) are reported as neither a file nor a
+    directory; any other reparse point, such as a OneDrive placeholder, is classified by
+    its directory attribute.
+
+    Parameters:
+        path: The directory to list.
+
+    Returns:
+        An iterator of (name, is_dir, is_file) tuples, without "." and "..".
+
+    Raises:
+        OSError: If the directory cannot be opened.
+    """
+    data = wintypes.WIN32_FIND_DATAW()
+    data_ref = ctypes.byref(data)
+    handle = _FindFirstFileExW(
+        path.rstrip("\\/") + "\\*",
+        _FIND_EX_INFO_BASIC,
+        data_ref,
+        _FIND_EX_SEARCH_NAME_MATCH,
+        None,
+        _FIND_FIRST_EX_LARGE_FETCH
+    )
+    if handle == _INVALID_HANDLE_VALUE:
+        error = ctypes.get_last_error()
+        if error == _ERROR_FILE_NOT_FOUND:
+            return
+        raise ctypes.WinError(error)
+    # Bind the per-entry lookups to locals.
+    find_next = _FindNextFileW
+    reparse_point = _FILE_ATTRIBUTE_REPARSE_POINT
+    directory = _FILE_ATTRIBUTE_DIRECTORY
+    try:
+        found = True
+        while found:
+            name = data.cFileName
+            if name != "." and name != "..":
+                attributes = data.dwFileAttributes
+                # dwReserved0 holds the reparse tag only when the reparse attribute is set.
+                if attributes & reparse_point and _is_name_surrogate(data.dwReserved0):
+                    yield name, False, False
+                elif attributes & directory:
+                    yield name, True, False
+                else:
+                    yield name, False, True
+            found = find_next(handle, data_ref)
+    finally:
+        _FindClose(handle)
+
+
+def _scandir_portable(path: str) -> Iterator[Tuple[str, bool, bool]]:
+    """
+    List a directory with os.scandir.
+
+    Parameters:
+        path: The directory to list.
+
+    Returns:
+        An iterator of (name, is_dir, is_file) tuples.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            # Files are the common case, so they cost a single type check.
+            if entry.is_file(follow_symlinks=False):
+                yield entry.name, False, True
+            else:
+                yield entry.name, entry.is_dir(follow_symlinks=False), False
+
+
+# Directory lister used by the Python walkers.
+_list_dir = _scandir_win if sys.platform == "win32" else _scandir_portable
+
+
+def _dir_prefix(path: str) -> str:
+    """
+    Return the string to prepend to a directory's entry names to form their paths.
+    """
+    return path if path.endswith(("\\", "/")) else path + os.sep
+
+
+if sys.platform == "win32":
+    _advapi32 = ctypes.WinDLL("advapi32")
+    _RegOpenKeyExW = _advapi32.RegOpenKeyExW
+    _RegOpenKeyExW.argtypes = [
+        wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.POINTER(wintypes.HKEY)
+    ]
+    _RegOpenKeyExW.restype = wintypes.LONG
+    _RegEnumKeyExW = _advapi32.RegEnumKeyExW
+    _RegEnumKeyExW.argtypes = [
+        wintypes.HKEY, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD),
+        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p
+    ]
+    _RegEnumKeyExW.restype = wintypes.LONG
+    _RegQueryValueExW = _advapi32.RegQueryValueExW
+    _RegQueryValueExW.argtypes = [
+        wintypes.HKEY, wintypes.LPCWSTR, ctypes.c_void_p, ctypes.POINTER(wintypes.DWORD),
+        ctypes.c_void_p, ctypes.POINTER(wintypes.DWORD)
+    ]
+    _RegQueryValueExW.restype = wintypes.LONG
+    _RegCloseKey = _advapi32.RegCloseKey
+    _RegCloseKey.argtypes = [wintypes.HKEY]
+    _RegCloseKey.restype = wintypes.LONG
+
+    # Predefined keys are sign-extended 32-bit values.
+    _HKEY_CURRENT_USER = wintypes.HKEY(ctypes.c_long(0x80000001).value)
+    _HKEY_LOCAL_MACHINE = wintypes.HKEY(ctypes.c_long(0x80000002).value)
+
+_ERROR_SUCCESS = 0
+_ERROR_MORE_DATA = 234
+_ERROR_NO_MORE_ITEMS = 259
+_KEY_READ = 0x20019
+_KEY_WOW64_64KEY = 0x0100
+_KEY_WOW64_32KEY = 0x0200
+_REG_SZ = 1
+_REG_EXPAND_SZ = 2
+
+_UNINSTALL_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+# Seconds during which list_installed_applications returns its cached result.
+INSTALLED_APPS_TTL = 300
+
+
+def _read_uninstall_names(hive: "wintypes.HKEY", view: int) -> List[str]:
+    """
+    Read the display names of the programs listed under one Uninstall key.
+
+    Entries that Add/Remove Programs hides (SystemComponent set to 1, or updates that name
+    a ParentKeyName) are skipped, as are entries without a DisplayName.
+
+    Parameters:
+        hive: The predefined root key to read from.
+        view: KEY_WOW64_64KEY or KEY_WOW64_32KEY to pick a registry view, or 0.
+
+    Returns:
+        The display names, in enumeration order.
+    """
+    names: List[str] = []
+    uninstall = wintypes.HKEY()
+    if _RegOpenKeyExW(hive, _UNINSTALL_KEY, 0, _KEY_READ | view, ctypes.byref(uninstall)) != _ERROR_SUCCESS:
+        return names
+    # One name buffer and one value buffer are reused for every subkey.
+    key_name = ctypes.create_unicode_buffer(256)
+    value = ctypes.create_unicode_buffer(512)
+    flag = wintypes.DWORD()
+    size = wintypes.DWORD()
+    value_type = wintypes.DWORD()
+    try:
+        index = 0
+        while True:
+            size.value = len(key_name)
+            status = _RegEnumKeyExW(uninstall, index, key_name, ctypes.byref(size), None, None, None, None)
+            index += 1
+            if status == _ERROR_NO_MORE_ITEMS:
+                break
+            subkey = wintypes.HKEY()
+            if status != _ERROR_SUCCESS or _RegOpenKeyExW(
+                uninstall, key_name.value, 0, _KEY_READ | view, ctypes.byref(subkey)
+            ) != _ERROR_SUCCESS:
+                continue
+            try:
+                size.value = ctypes.sizeof(flag)
+                if (_RegQueryValueExW(subkey, "SystemComponent", None, None, ctypes.byref(flag), ctypes.byref(size))
+                        == _ERROR_SUCCESS and flag.value == 1):
+                    continue
+                if _RegQueryValueExW(subkey, "ParentKeyName", None, None, None, None) == _ERROR_SUCCESS:
+                    continue
+                size.value = ctypes.sizeof(value)
+                status = _RegQueryValueExW(
+                    subkey, "DisplayName", None, ctypes.byref(value_type), ctypes.byref(value), ctypes.byref(size)
+                )
+                if status == _ERROR_MORE_DATA:
+                    value = ctypes.create_unicode_buffer(size.value // ctypes.sizeof(ctypes.c_wchar) + 1)
+                    size.value = ctypes.sizeof(value)
+                    status = _RegQueryValueExW(
+                        subkey, "DisplayName", None, ctypes.byref(value_type), ctypes.byref(value), ctypes.byref(size)
+                    )
+                if status != _ERROR_SUCCESS or value_type.value not in (_REG_SZ, _REG_EXPAND_SZ):
+                    continue
+                # The stored string is not guaranteed to be NUL-terminated.
+                name = value[:size.value // ctypes.sizeof(ctypes.c_wchar)].split("\0", 1)[0]
+                if name:
+                    names.append(name)
+            finally:
+                _RegCloseKey(subkey)
+    finally:
+        _RegCloseKey(uninstall)
+    return names
+
+
+# GetDriveTypeW result for network drives.
+_DRIVE_REMOTE = 4
+# A lone root with at most this many subdirectories is walked inline without threads.
+_SEQUENTIAL_MAX_SUBDIRS = 4
+
+
+def _is_remote_path(path: str) -> bool:
+    """
+    Check whether a path lives on a network share.
+
+    Parameters:
+        path: The directory path to check.
+
+    Returns:
+        True for UNC paths and for drive letters that Windows reports as DRIVE_REMOTE.
+    """
+    if path.upper().startswith("\\\\?\\UNC\\"):
+        return True
+    if path.startswith("\\\\?\\"):
+        path = path[4:]
+    elif path.startswith("\\\\"):
+        return True
+    drive = os.path.splitdrive(path)[0]
+    if not drive or sys.platform != "win32":
+        return False
+    return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == _DRIVE_REMOTE
+
+
+def _choose_worker_count(paths: List[str]) -> int:
+    """
+    Pick a thread count for walking the given roots.
+
+    Network shares are latency-bound and get a wider fan-out, local disks get two threads
+    per CPU, and a single small root is walked sequentially.
+
+    Parameters:
+        paths: The root directories to walk.
+
+    Returns:
+        The number of worker threads to use; 1 means walk inline.
+    """
+    cpu_count = os.cpu_count() or 4
+    if any(_is_remote_path(p) for p in paths):
+        return min(32, cpu_count * 4)
+    if len(paths) == 1:
+        try:
+            with os.scandir(paths[0]) as it:
+                subdirs = sum(1 for entry in it if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            return 1
+        if subdirs <= _SEQUENTIAL_MAX_SUBDIRS:
+            return 1
+    return cpu_count * 2
+
+
+def _compile_name_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    Build a case-insensitive file name predicate for a glob pattern.
+
+    Plain '*.ext' patterns are checked with a suffix comparison; anything else is
+    translated to a regular expression once instead of going through fnmatch per entry.
+
+    Parameters:
+        pattern: The file name pattern to match (e.g., '*.txt').
+
+    Returns:
+        A function that returns True when a file name matches the pattern.
+    """
+    if (pattern.startswith("*.") and pattern.count("*") == 1
+            and "?" not in pattern and "[" not in pattern):
+        suffix = pattern[1:].lower()
+        return lambda name: name.lower().endswith(suffix)
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
+
+
+def split_skip_patterns(skip_patterns: List[str]) -> Tuple[FrozenSet[str], List[str], FrozenSet[str]]:
+    """
+    Sort the skip folder settings into the kinds of rule the scanner prunes with.
+
+    Every rule is lowercased, since folders are always matched case-insensitively. This is
+    the one classifier of skip_folders, shared by the scanner and the settings windows.
+
+    Parameters:
+        skip_patterns: The skip folder entries: folder names, glob patterns or absolute
+            folder paths added from the block folders window.
+
+    Returns:
+        A (names, globs, blocked) tuple of lowercased literal folder names, wildcard
+        patterns and absolute folder paths without a trailing separator.
+    """
+    names, globs, blocked = set(), [], set()
+    for pattern in skip_patterns:
+        if not pattern:
+            continue
+        lower = pattern.lower()
+        if os.path.isabs(pattern):
+            blocked.add(lower.rstrip("\\/"))
+        elif any(c in pattern for c in "*?["):
+            globs.append(lower)
+        else:
+            names.add(lower)
+    return frozenset(names), globs, frozenset(blocked)
+
+
+@dataclass
+class _Worker:
+    """
+    Per-thread state for the work-stealing walker in iter_files.
+
+    The owner pushes and pops directories at the right end of its deque without locking;
+    thieves take from the left end and serialize among themselves with steal_lock.
+    """
+    dirs: Deque[str] = field(default_factory=deque)
+    steal_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass(frozen=True)
+class _PruneRules:
+    """
+    Directory rules applied while walking, so excluded subtrees are never scanned.
+
+    All names, prefixes and patterns are lowercase; paths are compared lowercased.
+    """
+    names: FrozenSet[str] = PRUNED_DIR_NAMES
+    prefixes: Tuple[str, ...] = ()
+    glob_match: Optional[Callable[[str], object]] = None
+    blocked: Tuple[str, ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        ignore_prefixes: Tuple[str, ...] = (),
+        skip_names: FrozenSet[str] = frozenset(),
+        skip_globs: Optional[List[str]] = None,
+        blocked_abs: FrozenSet[str] = frozenset()
+    ) -> "_PruneRules":
+        """
+        Combine the scanner's pruning arguments into one set of rules.
+
+        Parameters:
+            ignore_prefixes: Lowercase path prefixes of directories that are not descended into.
+            skip_names: Directory names that are not descended into.
+            skip_globs: Directory name glob patterns that are not descended into.
+            blocked_abs: Absolute directory paths whose subtrees are not descended into.
+
+        Returns:
+            The rules for the walkers.
+        """
+        globs = [g.lower() for g in skip_globs or () if g]
+        return cls(
+            names=PRUNED_DIR_NAMES | {n.lower() for n in skip_names},
+            prefixes=tuple(ignore_prefixes),
+            # fnmatch.translate anchors each pattern, so the union must match a whole name.
+            glob_match=re.compile(
+                "(?:%s)" % "|".join(fnmatch.translate(g) for g in globs)
+            ).match if globs else None,
+            blocked=tuple(b.lower().rstrip("\\/") + os.sep for b in blocked_abs)
+        )
+
+    def is_pruned(self, name: str, path: str) -> bool:
+        """
+        Check whether a directory's subtree should be skipped by the walker.
+
+        Parameters:
+            name: The directory name.
+            path: The full directory path.
+
+        Returns:
+            True if any rule excludes the directory.
+        """
+        lower_name = name.lower()
+        if lower_name in self.names:
+            return True
+        if self.glob_match is not None and self.glob_match(lower_name):
+            return True
+        if not (self.prefixes or self.blocked):
+            return False
+        lower = path.lower()
+        if self.prefixes and lower.startswith(self.prefixes):
+            return True
+        return bool(self.blocked) and (lower + os.sep).startswith(self.blocked)
+
+    def excludes_file(self, path: str) -> bool:
+        """
+        Check a file path against the glob and blocked-folder rules.
+
+        Used to post-filter the native walker, which only prunes by name and prefix.
+
+        Parameters:
+            path: The full file path.
+
+        Returns:
+            True if one of the file's folders is excluded.
+        """
+        lower = path.lower()
+        if self.blocked and lower.startswith(self.blocked):
+            return True
+        if self.glob_match is None:
+            return False
+        glob_match = self.glob_match
+        return any(glob_match(part) for part in lower.split(os.sep)[1:-1])
+
+
+def _compile_ext_matcher(ext_whitelist: Optional[FrozenSet[str]]) -> Callable[[str], bool]:
+    """
+    Build a file name predicate for an extension whitelist.
+
+    Parameters:
+        ext_whitelist: Optional set of lowercase extensions (e.g. '.txt'); None keeps every file.
+
+    Returns:
+        A function that returns True when a file name should be kept.
+    """
+    if ext_whitelist is None:
+        return lambda name: True
+    return lambda name: (dot := name.rfind(".")) >= 0 and name[dot:].lower() in ext_whitelist
+
+
+def _rechunk(batches: Iterable[List[str]], chunk_size: int) -> Iterator[List[str]]:
+    """
+    Regroup batches of paths of any size into chunks of at most chunk_size paths.
+
+    Parameters:
+        batches: The batches to regroup.
+        chunk_size: The maximum number of paths per chunk.
+
+    Yields:
+        Lists of up to chunk_size paths, in order.
+    """
+    pending: List[str] = []
+    for batch in batches:
+        pending.extend(batch)
+        if len(pending) >= chunk_size:
+            full = len(pending) - len(pending) % chunk_size
+            for i in range(0, full, chunk_size):
+                yield pending[i:i + chunk_size]
+            pending = pending[full:]
+    if pending:
+        yield pending
+
+
+def _walk_inline(
+    paths: List[str],
+    match: Callable[[str], bool],
+    rules: "_PruneRules",
+    chunk_size: int
+) -> Iterator[List[str]]:
+    """
+    Walk the trees on the calling thread, yielding matching files as chunks fill.
+
+    Parameters:
+        paths: The root directories to walk.
+        match: The file name predicate.
+        rules: The directory pruning rules.
+        chunk_size: The maximum number of paths per chunk.
+
+    Yields:
+        Lists of up to chunk_size matching file paths.
+    """
+    stack = list(reversed(paths))
+    _pop = stack.pop
+    _push = stack.append
+    _list = _list_dir
+    _is_pruned = rules.is_pruned
+    chunk: List[str] = []
+    _append = chunk.append
+    while stack:
+        current_dir = _pop()
+        try:
+            prefix = _dir_prefix(current_dir)
+            for name, is_dir, is_file in _list(current_dir):
+                if is_file:
+                    if match(name):
+                        _append(prefix + name)
+                elif is_dir:
+                    path = prefix + name
+                    if not _is_pruned(name, path):
+                        _push(path)
+        except OSError:
+            # Skip directories that cannot be read (permission denied, removed, ...).
+            pass
+        if len(chunk) >= chunk_size:
+            # Yielded outside the listing so no directory handle stays open while the
+            # consumer works on the chunk.
+            yield from _rechunk([chunk], chunk_size)
+            chunk = []
+            _append = chunk.append
+    if chunk:
+        yield chunk
+
+
+def _walk_chunks(
+    paths: List[str],
+    match: Callable[[str], bool],
+    rules: "_PruneRules",
+    chunk_size: int
+) -> Iterator[List[str]]:
+    """
+    Walk the trees with the work-stealing thread pool, yielding matching files in chunks.
+
+    Each worker thread (see _choose_worker_count) traverses the tree from its own deque of
+    directories, stealing from the others when it runs out, and hands every full chunk to
+    the caller through a queue. A single worker walks on the calling thread instead.
+    Closing the iterator early stops the walk.
+
+    Parameters:
+        paths: The root directories to walk.
+        match: The file name predicate.
+        rules: The directory pruning rules.
+        chunk_size: The maximum number of paths per chunk.
+
+    Yields:
+        Lists of up to chunk_size matching file paths.
+
+    Raises:
+        Exception: Whatever unexpected error stopped a worker.
+    """
+    if not paths:
+        return
+
+    worker_count = _choose_worker_count(paths)
+    if worker_count == 1:
+        # Nothing to steal from; walk the small tree on the calling thread and hand each
+        # chunk over as soon as it fills.
+        yield from _walk_inline(paths, match, rules, chunk_size)
+        return
+
+    workers = [_Worker() for _ in range(worker_count)]
+    # Spread the initial directories across the workers' deques.
+    for i, p in enumerate(paths):
+        workers[i % worker_count].dirs.append(p)
+
+    idle = 0
+    idle_lock = threading.Lock()
+    finished = threading.Event()
+    # Full chunks of matches, the exception of a worker that failed, and one None from
+    # each worker when it exits.
+    results: "queue.SimpleQueue[Optional[Union[List[str], Exception]]]" = queue.SimpleQueue()
+
+    def steal(me: _Worker) -> List[str]:
+        """
+        Take roughly half of the oldest directories from another worker's deque.
+        """
+        start = random.randrange(worker_count)
+        for offset in range(worker_count):
+            victim = workers[(start + offset) % worker_count]
+            if victim is me or not victim.dirs:
+                continue
+            loot: List[str] = []
+            with victim.steal_lock:
+                # The owner pops from the other end concurrently; deque operations are
+                # atomic, so an emptied deque just ends the steal early.
+                for _ in range(max(1, len(victim.dirs) // 2)):
+                    try:
+                        loot.append(victim.dirs.popleft())
+                    except IndexError:
+                        break
+            if loot:
+                return loot
+        return []
+
+    def worker(me: _Worker) -> None:
+        """
+        Worker function that walks its own deque LIFO and steals when it runs dry.
+        """
+        nonlocal idle
+        dirs = me.dirs
+        # Bind hot attributes to locals once per worker.
+        _pop = dirs.pop
+        _push = dirs.append
+        _list = _list_dir
+        _is_pruned = rules.is_pruned
+        _put = results.put
+        _match = match
+        chunk: List[str] = []
+        _append = chunk.append
+        failed_steals = 0
+        try:
+            while not finished.is_set():
+                try:
+                    current_dir = _pop()
+                except IndexError:
+                    # Count as busy while stealing so nobody can observe every worker idle
+                    # while this one holds stolen directories.
+                    loot = steal(me)
+                    if loot:
+                        failed_steals = 0
+                        dirs.extend(loot)
+                        continue
+                    with idle_lock:
+                        idle += 1
+                        if idle == worker_count:
+                            finished.set()
+                            return
+                    failed_steals += 1
+                    if failed_steals >= _STEAL_ATTEMPTS_BEFORE_BACKOFF:
+                        time.sleep(_STEAL_BACKOFF_SECONDS)
+                    with idle_lock:
+                        idle -= 1
+                    continue
+
+                try:
+                    prefix = _dir_prefix(current_dir)
+                    for name, is_dir, is_file in _list(current_dir):
+                        if is_file and _match(name):
+                            _append(prefix + name)
+                            if len(chunk) >= chunk_size:
+                                _put(chunk)
+                                chunk = []
+                                _append = chunk.append
+                        elif is_dir:
+                            path = prefix + name
+                            if _is_pruned(name, path):
+                                continue
+                            _push(path)
+                except OSError:
+                    # Skip directories that cannot be read (permission denied, removed, ...).
+                    # Letting the error escape would leave this worker never marked idle.
+                    pass
+        except Exception as e:
+            # This worker can never be counted idle again, so stop the others instead of
+            # letting them wait for it, and hand the error to the consumer.
+            finished.set()
+            _put(e)
+        finally:
+            if chunk:
+                _put(chunk)
+            _put(None)
+
+    executor = ThreadPoolExecutor(max_workers=worker_count)
+    for w in workers:
+        executor.submit(worker, w)
+    try:
+        running = worker_count
+        while running:
+            chunk = results.get()
+            if chunk is None:
+                running -= 1
+            elif isinstance(chunk, Exception):
+                raise chunk
+            else:
+                yield chunk
+    finally:
+        # Stops the workers when the caller abandons the iterator before the walk ends.
+        finished.set()
+        executor.shutdown(wait=False)
 
 
 class FileScraper:
@@ -12,7 +727,8 @@ class FileScraper:
     A class for performing concurrent file scanning and retrieving system information.
 
     This class provides methods to:
-      - Find files matching a specific pattern in a set of directories.
+      - Find files matching a specific pattern in a set of directories, all at once or
+        streamed in chunks.
       - Recursively scan directories for all file paths.
       - List installed applications from the Windows registry.
     """
@@ -24,145 +740,333 @@ class FileScraper:
         self.text_file_pattern: str = '*.txt'
         self.image_patterns: List[str] = ['*.png', '*.jpg', '*.jpeg', '*.gif']
         self.video_patterns: List[str] = ['*.mp4', '*.avi', '*.mkv']
+        # (monotonic timestamp, names) from the last registry sweep.
+        self._installed_apps: Optional[Tuple[float, List[str]]] = None
 
     def find_files(
         self,
         pattern: str,
         paths: List[str],
-        file_found_callback: Optional[Callable[[str], None]] = None
+        file_found_callback: Optional[Callable[[str], None]] = None,
+        ignore_prefixes: Tuple[str, ...] = (),
+        skip_names: FrozenSet[str] = frozenset(),
+        skip_globs: Optional[List[str]] = None,
+        blocked_abs: FrozenSet[str] = frozenset()
     ) -> List[str]:
         """
         Find files matching the specified pattern in the provided directories concurrently.
 
-        This method uses a queue with a pool of worker threads to traverse the directory
-        tree and collect file paths matching the glob pattern.
+        Collects the chunks produced by iter_files into one list.
 
         Parameters:
             pattern: The file name pattern to match (e.g., '*.txt').
             paths: A list of directory paths in which to search.
             file_found_callback: An optional callback function invoked with each found file path.
+            ignore_prefixes: Lowercase path prefixes of directories that are not descended into.
+            skip_names: Directory names that are not descended into.
+            skip_globs: Directory name glob patterns that are not descended into.
+            blocked_abs: Absolute directory paths whose subtrees are not descended into.
 
         Returns:
             A list of file paths that match the provided pattern.
         """
         matches: List[str] = []
-        lock = threading.Lock()
-        dir_queue: Queue[str] = Queue()
+        for chunk in self.iter_files(pattern, paths, ignore_prefixes, skip_names, skip_globs, blocked_abs):
+            matches.extend(chunk)
+            if file_found_callback:
+                for f in chunk:
+                    file_found_callback(f)
+        return matches
 
-        # Enqueue initial directories.
-        for p in paths:
-            dir_queue.put(p)
+    def iter_files(
+        self,
+        pattern: str,
+        paths: List[str],
+        ignore_prefixes: Tuple[str, ...] = (),
+        skip_names: FrozenSet[str] = frozenset(),
+        skip_globs: Optional[List[str]] = None,
+        blocked_abs: FrozenSet[str] = frozenset(),
+        *,
+        chunk_size: int = 512
+    ) -> Iterator[List[str]]:
+        """
+        Find files matching the specified pattern, yielding them in chunks as they are found.
 
-        def worker() -> None:
-            """
-            Worker function to process directories from the queue and search for matching files.
-            """
-            while True:
-                try:
-                    current_dir = dir_queue.get_nowait()
-                except Empty:
-                    break
+        When the native walker is available it enumerates the trees and the results are
+        matched against the pattern; otherwise the trees are walked by the work-stealing
+        thread pool (see _walk_chunks). Closing the iterator early stops the walk.
 
-                try:
-                    for entry in os.scandir(current_dir):
-                        if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
-                            with lock:
-                                matches.append(entry.path)
-                            if file_found_callback:
-                                file_found_callback(entry.path)
-                        elif entry.is_dir():
-                            dir_queue.put(entry.path)
-                except PermissionError:
-                    # Skip directories where permission is denied.
-                    pass
-                finally:
-                    dir_queue.task_done()
+        Parameters:
+            pattern: The file name pattern to match (e.g., '*.txt').
+            paths: A list of directory paths in which to search.
+            ignore_prefixes: Lowercase path prefixes of directories that are not descended into.
+            skip_names: Directory names that are not descended into.
+            skip_globs: Directory name glob patterns that are not descended into.
+            blocked_abs: Absolute directory paths whose subtrees are not descended into.
+            chunk_size: The maximum number of paths per chunk.
 
-        # Use a pool of worker threads.
-        worker_count = 64
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            for _ in range(worker_count):
-                executor.submit(worker)
-            dir_queue.join()
+        Yields:
+            Lists of up to chunk_size matching file paths.
+        """
+        match = _compile_name_matcher(pattern)
+        rules = _PruneRules.build(ignore_prefixes, skip_names, skip_globs, blocked_abs)
+        if _native_walk_tree is not None:
+            matches = [
+                f for f in _native_walk_tree(list(paths), rules.names, rules.prefixes)
+                if match(f[f.rfind(os.sep) + 1:]) and not rules.excludes_file(f)
+            ]
+            for i in range(0, len(matches), chunk_size):
+                yield matches[i:i + chunk_size]
+            return
 
-        return matches
+        yield from _walk_chunks(paths, match, rules, chunk_size)
 
-    def scan_all_files(self, paths: List[str]) -> List[str]:
+    def scan_all_files(
+        self,
+        paths: List[str],
+        ext_whitelist: Optional[FrozenSet[str]] = None,
+        ignore_prefixes: Tuple[str, ...] = (),
+        skip_names: FrozenSet[str] = frozenset(),
+        skip_globs: Optional[List[str]] = None,
+        blocked_abs: FrozenSet[str] = frozenset()
+    ) -> List[str]:
         """
         Recursively scan the provided directories and return all file paths found.
 
-        This method uses a concurrent approach to traverse directories and collect file paths.
+        The native FindFirstFileExW walker is used when available. Otherwise, on CPython
+        3.13+ for Windows the scan is delegated to scan_all_files_os_walk, and elsewhere
+        each root directory is walked by its own worker thread.
 
         Parameters:
             paths: A list of directory paths to scan.
+            ext_whitelist: Optional set of lowercase extensions (e.g. '.txt'); when given,
+                only files with one of these extensions are returned.
+            ignore_prefixes: Lowercase path prefixes of directories that are not descended into.
+            skip_names: Directory names that are not descended into.
+            skip_globs: Directory name glob patterns that are not descended into.
+            blocked_abs: Absolute directory paths whose subtrees are not descended into.
 
         Returns:
             A list of all file paths discovered during the scan.
         """
-        all_files: List[str] = []
-        lock = threading.Lock()
-        dir_queue: Queue[str] = Queue()
+        rules = _PruneRules.build(ignore_prefixes, skip_names, skip_globs, blocked_abs)
+        if _native_walk_tree is not None:
+            files = _native_walk_tree(list(paths), rules.names, rules.prefixes)
+            if rules.glob_match is not None or rules.blocked:
+                files = [f for f in files if not rules.excludes_file(f)]
+            if ext_whitelist is not None:
+                files = [
+                    f for f in files
+                    if (dot := f.rfind(".")) > f.rfind(os.sep) and f[dot:].lower() in ext_whitelist
+                ]
+            return files
 
-        # Enqueue the initial directory paths.
-        for p in paths:
-            dir_queue.put(p)
+        if _PREFER_OS_WALK:
+            return self.scan_all_files_os_walk(
+                paths, ext_whitelist, ignore_prefixes, skip_names, skip_globs, blocked_abs
+            )
 
-        def worker() -> None:
-            """
-            Worker function to traverse directories from the queue and collect file paths.
-            """
-            while True:
-                try:
-                    current_dir = dir_queue.get_nowait()
-                except Empty:
-                    break
+        # Shard the walk by root: each worker walks one tree into its own list, so no
+        # queue, lock or shared buffer is touched while walking.
+        if not paths:
+            return []
+        # Shards are per root, so a single root is walked inline without probing it.
+        worker_count = 1 if len(paths) == 1 else min(len(paths), _choose_worker_count(paths))
+        if worker_count == 1:
+            shards = [self._walk_root(p, ext_whitelist, rules) for p in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                futures = [
+                    executor.submit(self._walk_root, p, ext_whitelist, rules)
+                    for p in paths
+                ]
+                shards = [future.result() for future in as_completed(futures)]
+        # A single shard is returned as is rather than copied.
+        if len(shards) == 1:
+            return shards[0]
+        return list(itertools.chain.from_iterable(shards))
 
-                try:
-                    for entry in os.scandir(current_dir):
-                        if entry.is_file():
-                            with lock:
-                                all_files.append(entry.path)
-                        elif entry.is_dir():
-                            dir_queue.put(entry.path)
-                except PermissionError:
-                    # Skip directories that cannot be accessed.
-                    pass
-                finally:
-                    dir_queue.task_done()
+    def iter_scan(
+        self,
+        paths: List[str],
+        ext_whitelist: Optional[FrozenSet[str]] = None,
+        ignore_prefixes: Tuple[str, ...] = (),
+        skip_names: FrozenSet[str] = frozenset(),
+        skip_globs: Optional[List[str]] = None,
+        blocked_abs: FrozenSet[str] = frozenset(),
+        *,
+        chunk_size: int = 512
+    ) -> Iterator[List[str]]:
+        """
+        Scan the provided directories like scan_all_files, yielding the files in chunks.
+
+        The Python walkers hand over each chunk as soon as it is full, so the whole result
+        never has to be held at once. The native walker returns its result in one piece,
+        which is then split into chunks.
+
+        Parameters:
+            paths: A list of directory paths to scan.
+            ext_whitelist: Optional set of lowercase extensions (e.g. '.txt'); when given,
+                only files with one of these extensions are returned.
+            ignore_prefixes: Lowercase path prefixes of directories that are not descended into.
+            skip_names: Directory names that are not descended into.
+            skip_globs: Directory name glob patterns that are not descended into.
+            blocked_abs: Absolute directory paths whose subtrees are not descended into.
+            chunk_size: The maximum number of paths per chunk.
+
+        Yields:
+            Lists of up to chunk_size file paths.
+        """
+        if _native_walk_tree is not None:
+            files = self.scan_all_files(
+                paths, ext_whitelist, ignore_prefixes, skip_names, skip_globs, blocked_abs
+            )
+            yield from _rechunk([files], chunk_size)
+            return
+
+        rules = _PruneRules.build(ignore_prefixes, skip_names, skip_globs, blocked_abs)
+        if _PREFER_OS_WALK:
+            yield from _rechunk(self._os_walk_batches(paths, ext_whitelist, rules), chunk_size)
+            return
+        yield from _walk_chunks(paths, _compile_ext_matcher(ext_whitelist), rules, chunk_size)
+
+    def scan_all_files_os_walk(
+        self,
+        paths: List[str],
+        ext_whitelist: Optional[FrozenSet[str]] = None,
+        ignore_prefixes: Tuple[str, ...] = (),
+        skip_names: FrozenSet[str] = frozenset(),
+        skip_globs: Optional[List[str]] = None,
+        blocked_abs: FrozenSet[str] = frozenset()
+    ) -> List[str]:
+        """
+        Recursively scan the provided directories sequentially with os.walk.
+
+        Takes the same arguments and returns the same result as scan_all_files.
+
+        Parameters:
+            paths: A list of directory paths to scan.
+            ext_whitelist: Optional set of lowercase extensions to keep.
+            ignore_prefixes: Lowercase path prefixes of directories that are not descended into.
+            skip_names: Directory names that are not descended into.
+            skip_globs: Directory name glob patterns that are not descended into.
+            blocked_abs: Absolute directory paths whose subtrees are not descended into.
+
+        Returns:
+            A list of all file paths discovered during the scan.
+        """
+        rules = _PruneRules.build(ignore_prefixes, skip_names, skip_globs, blocked_abs)
+        files: List[str] = []
+        for batch in self._os_walk_batches(paths, ext_whitelist, rules):
+            files.extend(batch)
+        return files
 
-        worker_count = 64
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            for _ in range(worker_count):
-                executor.submit(worker)
-            dir_queue.join()
+    @staticmethod
+    def _os_walk_batches(
+        paths: List[str],
+        ext_whitelist: Optional[FrozenSet[str]],
+        rules: _PruneRules
+    ) -> Iterator[List[str]]:
+        """
+        Walk the directories sequentially with os.walk, one batch of files per directory.
 
-        return all_files
+        Parameters:
+            paths: A list of directory paths to scan.
+            ext_whitelist: Optional set of lowercase extensions to keep.
+            rules: The directory pruning rules.
+
+        Yields:
+            The kept file paths of each directory walked.
+        """
+        join = os.path.join
+        for p in paths:
+            # os.walk skips directories it cannot list, like the other walkers.
+            for root, dirs, names in os.walk(p):
+                dirs[:] = [d for d in dirs if not rules.is_pruned(d, join(root, d))]
+                if ext_whitelist is not None:
+                    names = [
+                        n for n in names
+                        if (dot := n.rfind(".")) >= 0 and n[dot:].lower() in ext_whitelist
+                    ]
+                if names:
+                    yield [join(root, n) for n in names]
+
+    @staticmethod
+    def _walk_root(
+        root: str,
+        ext_whitelist: Optional[FrozenSet[str]],
+        rules: _PruneRules
+    ) -> List[str]:
+        """
+        Walk a single directory tree iteratively and collect its file paths.
+
+        Parameters:
+            root: The directory to walk.
+            ext_whitelist: Optional set of lowercase extensions to keep.
+            rules: The directory pruning rules.
+
+        Returns:
+            A list of file paths found below the root.
+        """
+        files: List[str] = []
+        stack = [root]
+        # Bind hot attributes to locals once per walk.
+        _pop = stack.pop
+        _push = stack.append
+        _append = files.append
+        _list = _list_dir
+        _is_pruned = rules.is_pruned
+        while stack:
+            current_dir = _pop()
+            try:
+                prefix = _dir_prefix(current_dir)
+                for name, is_dir, is_file in _list(current_dir):
+                    if is_file:
+                        if ext_whitelist is not None:
+                            dot = name.rfind(".")
+                            if dot < 0 or name[dot:].lower() not in ext_whitelist:
+                                continue
+                        _append(prefix + name)
+                    elif is_dir:
+                        # Prune ignored subtrees before they are ever scanned.
+                        path = prefix + name
+                        if _is_pruned(name, path):
+                            continue
+                        _push(path)
+            except OSError:
+                # Skip directories that cannot be read (permission denied, removed mid-walk, ...)
+                # so one bad folder never aborts the whole scan.
+                pass
+        return files
 
     def list_installed_applications(self) -> List[str]:
         """
         Retrieve a list of installed applications from the Windows registry.
 
-        The method queries the Uninstall registry key for installed applications and
-        returns the list of display names.
+        The 64-bit and 32-bit (WOW6432Node) machine Uninstall keys and the current user's
+        Uninstall key are enumerated in one sweep, skipping the entries Add/Remove Programs
+        hides. The result is cached on the instance for INSTALLED_APPS_TTL seconds.
 
         Returns:
             A list of application names installed on the system.
         """
+        cached = self._installed_apps
+        if cached is not None and time.monotonic() - cached[0] < INSTALLED_APPS_TTL:
+            return list(cached[1])
         applications: List[str] = []
-        uninstall_key = r'SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall'
         try:
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, uninstall_key) as key:
-                num_subkeys = winreg.QueryInfoKey(key)[0]
-                for i in range(num_subkeys):
-                    try:
-                        subkey_name = winreg.EnumKey(key, i)
-                        with winreg.OpenKey(key, subkey_name) as subkey:
-                            name = winreg.QueryValueEx(subkey, 'DisplayName')[0]
-                            applications.append(name)
-                    except OSError:
-                        # Skip keys without a DisplayName or inaccessible keys.
-                        continue
+            views = (
+                (_HKEY_LOCAL_MACHINE, _KEY_WOW64_64KEY),
+                (_HKEY_LOCAL_MACHINE, _KEY_WOW64_32KEY),
+                (_HKEY_CURRENT_USER, 0),
+            )
+            # An application registered in more than one view is listed once.
+            applications = list(dict.fromkeys(itertools.chain.from_iterable(
+                _read_uninstall_names(hive, view) for hive, view in views
+            )))
         except Exception as e:
             # Log or handle exception as needed.
             print(f"Error accessing registry: {e}")
-        return applications
+            return applications
+        self._installed_apps = (time.monotonic(), applications)
+        return list(applications)
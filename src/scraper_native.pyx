@@ -0,0 +1,169 @@
+# distutils: language = c++
+# cython: language_level=3
+"""
+Native directory walker for FileScraper built on FindFirstFileExW.
+
+Build in place with ``cythonize -i src/scraper_native.pyx``. When the compiled
+module is not available, FileScraper falls back to its os.scandir implementation.
+"""
+from cpython.list cimport PyList_Append
+from libc.stddef cimport wchar_t
+from libcpp.vector cimport vector
+
+
+cdef extern from "Python.h":
+    wchar_t* PyUnicode_AsWideCharString(object unicode, Py_ssize_t* size) except NULL
+    object PyUnicode_FromWideChar(const wchar_t* w, Py_ssize_t size)
+    void PyMem_Free(void* p)
+
+
+cdef extern from "<string>" namespace "std" nogil:
+    cdef cppclass wstring:
+        wstring() except +
+        wstring(const wchar_t*) except +
+        wstring(const wstring&) except +
+        const wchar_t* c_str()
+        size_t size()
+        wstring& append(const wchar_t*) except +
+
+
+cdef extern from *:
+    """
+    static const wchar_t WALK_SUFFIX[] = L"\\\\*";
+    static const wchar_t WALK_SEP[] = L"\\\\";
+    """
+    const wchar_t* WALK_SUFFIX
+    const wchar_t* WALK_SEP
+
+
+cdef extern from "<windows.h>" nogil:
+    ctypedef void* HANDLE
+    ctypedef unsigned long DWORD
+    ctypedef int BOOL
+
+    ctypedef struct WIN32_FIND_DATAW:
+        DWORD dwFileAttributes
+        DWORD dwReserved0
+        wchar_t cFileName[260]
+
+    ctypedef enum FINDEX_INFO_LEVELS:
+        FindExInfoBasic
+
+    ctypedef enum FINDEX_SEARCH_OPS:
+        FindExSearchNameMatch
+
+    HANDLE INVALID_HANDLE_VALUE
+    DWORD FIND_FIRST_EX_LARGE_FETCH
+    DWORD FILE_ATTRIBUTE_DIRECTORY
+    DWORD FILE_ATTRIBUTE_REPARSE_POINT
+    DWORD IO_REPARSE_TAG_SYMLINK
+    DWORD IO_REPARSE_TAG_MOUNT_POINT
+
+    HANDLE FindFirstFileExW(
+        const wchar_t* lpFileName,
+        FINDEX_INFO_LEVELS fInfoLevelId,
+        void* lpFindFileData,
+        FINDEX_SEARCH_OPS fSearchOp,
+        void* lpSearchFilter,
+        DWORD dwAdditionalFlags
+    )
+    BOOL FindNextFileW(HANDLE hFindFile, WIN32_FIND_DATAW* lpFindFileData)
+    BOOL FindClose(HANDLE hFindFile)
+
+
+cdef inline bint _is_name_surrogate(DWORD attributes, DWORD tag) nogil:
+    # Symbolic links, junctions and other name surrogates are skipped like the Python
+    # walkers do; other reparse points (e.g. OneDrive placeholders) are regular entries.
+    # The tag in dwReserved0 is only meaningful when the reparse attribute is set.
+    if not attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+        return False
+    return (tag == IO_REPARSE_TAG_SYMLINK or tag == IO_REPARSE_TAG_MOUNT_POINT
+            or (tag & 0x20000000) != 0)
+
+
+cdef inline bint _is_dot_entry(const wchar_t* name) nogil:
+    # Skip the "." and ".." pseudo-entries returned by FindFirstFileExW.
+    return name[0] == 46 and (name[1] == 0 or (name[1] == 46 and name[2] == 0))
+
+
+cdef bint _is_pruned(wstring& path, const wchar_t* name, skip_names, tuple ignore_prefixes):
+    # Directory names are only materialized as Python strings when a prune rule is set.
+    if skip_names and PyUnicode_FromWideChar(name, -1).lower() in skip_names:
+        return True
+    if ignore_prefixes and PyUnicode_FromWideChar(path.c_str(), path.size()).lower().startswith(ignore_prefixes):
+        return True
+    return False
+
+
+def walk_tree(list roots, skip_names=frozenset(), tuple ignore_prefixes=()):
+    """
+    Recursively collect every file path below the given root directories.
+
+    Directories are walked iteratively from a local stack, and the GIL is released
+    around the Win32 enumeration calls. Symbolic links and junctions (name-surrogate
+    reparse points) are skipped whether they point at files or directories, and
+    directories that cannot be opened are skipped.
+
+    Parameters:
+        roots: A list of directory paths to walk.
+        skip_names: Lowercase directory names that are not descended into.
+        ignore_prefixes: Lowercase path prefixes of directories that are not descended into.
+
+    Returns:
+        A list of all file paths discovered during the walk.
+    """
+    cdef list out = []
+    cdef vector[wstring] stack
+    cdef wstring current
+    cdef wstring pattern
+    cdef wstring child
+    cdef WIN32_FIND_DATAW data
+    cdef HANDLE handle
+    cdef wchar_t* buf
+    cdef BOOL found
+
+    for root in roots:
+        buf = PyUnicode_AsWideCharString(root, NULL)
+        try:
+            stack.push_back(wstring(buf))
+        finally:
+            PyMem_Free(buf)
+
+        while not stack.empty():
+            current = stack.back()
+            stack.pop_back()
+            pattern = wstring(current)
+            pattern.append(WALK_SUFFIX)
+
+            with nogil:
+                handle = FindFirstFileExW(
+                    pattern.c_str(),
+                    FindExInfoBasic,
+                    &data,
+                    FindExSearchNameMatch,
+                    NULL,
+                    FIND_FIRST_EX_LARGE_FETCH
+                )
+            if handle == INVALID_HANDLE_VALUE:
+                # Skip directories that cannot be accessed.
+                continue
+
+            try:
+                found = 1
+                while found:
+                    if not _is_dot_entry(data.cFileName) and not _is_name_surrogate(
+                            data.dwFileAttributes, data.dwReserved0):
+                        child = wstring(current)
+                        child.append(WALK_SEP)
+                        child.append(data.cFileName)
+                        if data.dwFileAttributes & FILE_ATTRIBUTE_DIRECTORY:
+                            if not _is_pruned(child, data.cFileName, skip_names, ignore_prefixes):
+                                stack.push_back(child)
+                        else:
+                            PyList_Append(out, PyUnicode_FromWideChar(child.c_str(), child.size()))
+                    with nogil:
+                        found = FindNextFileW(handle, &data)
+            finally:
+                FindClose(handle)
+
+    return out
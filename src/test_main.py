@@ -0,0 +1,42 @@
+import fnmatch
+import re
+import unittest
+
+try:
+    import main
+except ImportError:
+    # main imports winreg, which only exists on Windows.
+    main = None
+
+
+@unittest.skipIf(main is None, "main requires Windows")
+class GlobToRegexTest(unittest.TestCase):
+    """
+    Check that _glob_to_regex agrees with fnmatch.fnmatchcase on every path component.
+    """
+
+    PATTERNS = [
+        "a[!b]c", "[!]]x", "[!-a]b", "[]a]", "[!a-]", "[a-c]?", "*[!x]", "[^a]",
+        "[!\\]z", "x[", "node_modules", "*.tmp", "build?",
+    ]
+    COMPONENTS = [
+        "abc", "a", "c", "acc", "]x", "-b", "ab", "xy", "zy", "b", "^", "x[", "cz",
+        "node_modules", "cache.tmp", "build1", "build",
+    ]
+
+    def test_matches_like_fnmatch_per_component(self) -> None:
+        """
+        A path is excluded by the folder expression exactly when some folder matches the glob.
+        """
+        for pattern in self.PATTERNS:
+            regex = re.compile(r"\\(?:" + main._glob_to_regex(pattern) + r")(?:\\|$)")
+            paths = [f"c:\\users\\{c}\\file.txt" for c in self.COMPONENTS]
+            paths += [f"c:\\users\\{a}\\{b}\\file.txt" for a in self.COMPONENTS for b in self.COMPONENTS]
+            for path in paths:
+                expected = any(fnmatch.fnmatchcase(part, pattern) for part in path.split("\\")[1:])
+                with self.subTest(pattern=pattern, path=path):
+                    self.assertEqual(regex.search(path) is not None, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
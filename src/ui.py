@@ -1,12 +1,405 @@
-import contextlib
+import bisect
+import ctypes
+import functools
 import os
 import json
+import queue
 import fnmatch
-import shutil
+import re
+import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Optional
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
+from tkinter import ttk
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard json module when orjson is not installed.
+    orjson = None
+
+from scraper import split_skip_patterns
+
+# Milliseconds between polls of the backup progress queue on the Tk thread.
+BACKUP_POLL_MS = 50
+# Number of files copied concurrently during a backup. Kernel-side copies saturate the
+# disk queue well before this, and more threads only add seek contention.
+BACKUP_WORKERS = min(8, os.cpu_count() or 4)
+# Minimum number of seconds between updates of the current file label.
+CURRENT_FILE_INTERVAL = 0.05
+_current_file_shown_at = 0.0
+
+# Lowercase names of the C:\Users folders that are not user accounts.
+_IGNORED_USER_DIRS = frozenset({"public", "default", "default user", "all users"})
+
+# Parsed settings.json document, keyed by the file's (st_mtime_ns, st_size).
+_SETTINGS_CACHE: dict[tuple[int, int], dict] = {}
+
+# Backup category folder for each file extension collected by a full scan.
+_EXT_CATEGORY = {
+    ".txt": "text_files",
+    ".asc": "text_files",
+    ".png": "images",
+    ".jpg": "images",
+    ".jpeg": "images",
+    ".gif": "images",
+    ".mp4": "videos",
+    ".avi": "videos",
+    ".mkv": "videos",
+    ".mp3": "music",
+}
+# Backup category folder for the files of each single-type scan mode.
+_TYPE_CATEGORY = {
+    "text": "text_files",
+    "image": "images",
+    "video": "videos",
+}
+
+# Files larger than this are copied with CopyFileExW and no buffering on Windows.
+_UNBUFFERED_COPY_MIN_SIZE = 1024 * 1024
+_COPY_FILE_NO_BUFFERING = 0x00001000
+_FSCTL_DUPLICATE_EXTENTS_TO_FILE = 0x00098344
+# Largest range cloned per FSCTL_DUPLICATE_EXTENTS_TO_FILE call (the limit is just under 4 GiB).
+_CLONE_CHUNK = 1 << 30
+
+if sys.platform == "win32":
+    import msvcrt
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CopyFileExW = _kernel32.CopyFileExW
+    _CopyFileExW.argtypes = [
+        wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD
+    ]
+    _CopyFileExW.restype = wintypes.BOOL
+    _GetVolumePathNameW = _kernel32.GetVolumePathNameW
+    _GetVolumePathNameW.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD]
+    _GetVolumePathNameW.restype = wintypes.BOOL
+    _GetVolumeInformationW = _kernel32.GetVolumeInformationW
+    _GetVolumeInformationW.argtypes = [
+        wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD, wintypes.LPDWORD,
+        wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPWSTR, wintypes.DWORD
+    ]
+    _GetVolumeInformationW.restype = wintypes.BOOL
+    _GetDiskFreeSpaceW = _kernel32.GetDiskFreeSpaceW
+    _GetDiskFreeSpaceW.argtypes = [
+        wintypes.LPCWSTR, wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD
+    ]
+    _GetDiskFreeSpaceW.restype = wintypes.BOOL
+    _DeviceIoControl = _kernel32.DeviceIoControl
+    _DeviceIoControl.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD, wintypes.LPDWORD, ctypes.c_void_p
+    ]
+    _DeviceIoControl.restype = wintypes.BOOL
+
+    class _DuplicateExtentsData(ctypes.Structure):
+        _fields_ = [
+            ("FileHandle", wintypes.HANDLE),
+            ("SourceFileOffset", ctypes.c_longlong),
+            ("TargetFileOffset", ctypes.c_longlong),
+            ("ByteCount", ctypes.c_longlong),
+        ]
+
+
+def _volume_root(path: str) -> Optional[str]:
+    """
+    Return the root of the volume holding a path (e.g. 'C:\\'), or None if it cannot be resolved.
+    """
+    buf = ctypes.create_unicode_buffer(1024)
+    if not _GetVolumePathNameW(path, buf, len(buf)):
+        return None
+    return buf.value
+
+
+@functools.lru_cache(maxsize=None)
+def _volume_clone_info(root: str) -> Optional[int]:
+    """
+    Report whether a volume supports block cloning.
+    
+    Parameters:
+        root: The volume root, as returned by _volume_root.
+    
+    Returns:
+        The volume's cluster size if it is formatted with ReFS, otherwise None.
+    """
+    fs_name = ctypes.create_unicode_buffer(32)
+    if not _GetVolumeInformationW(root, None, 0, None, None, None, fs_name, len(fs_name)):
+        return None
+    if fs_name.value.upper() != "REFS":
+        return None
+    sectors, sector_size, free, total = (wintypes.DWORD() for _ in range(4))
+    if not _GetDiskFreeSpaceW(root, ctypes.byref(sectors), ctypes.byref(sector_size),
+                              ctypes.byref(free), ctypes.byref(total)):
+        return None
+    return sectors.value * sector_size.value
+
+
+def _clone_file(src_path: str, dst_path: str, cluster_size: int) -> None:
+    """
+    Copy a file on a ReFS volume by sharing its data blocks instead of moving any data.
+    
+    Parameters:
+        src_path: The file to copy.
+        dst_path: The destination file path, on the same volume.
+        cluster_size: The volume's cluster size.
+    
+    Raises:
+        OSError: If the volume refuses to clone the file.
+    """
+    import shutil
+
+    size = os.path.getsize(src_path)
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        # The target must already be long enough to receive the cloned range.
+        dst.truncate(size)
+        data = _DuplicateExtentsData(FileHandle=msvcrt.get_osfhandle(src.fileno()))
+        dst_handle = msvcrt.get_osfhandle(dst.fileno())
+        returned = wintypes.DWORD()
+        # Ranges must end on a cluster boundary, even past the end of the file.
+        aligned = -(-size // cluster_size) * cluster_size
+        offset = 0
+        while offset < aligned:
+            data.SourceFileOffset = data.TargetFileOffset = offset
+            data.ByteCount = min(_CLONE_CHUNK, aligned - offset)
+            if not _DeviceIoControl(dst_handle, _FSCTL_DUPLICATE_EXTENTS_TO_FILE, ctypes.byref(data),
+                                    ctypes.sizeof(data), None, 0, ctypes.byref(returned), None):
+                raise ctypes.WinError(ctypes.get_last_error())
+            offset += data.ByteCount
+    shutil.copystat(src_path, dst_path)
+
+
+def _fast_copy(src_path: str, dst_path: str) -> None:
+    """
+    Copy a file with its metadata using the cheapest mechanism available.
+    
+    On Windows a same-volume copy on ReFS is block-cloned, and anything else is copied in
+    kernel mode by CopyFileExW (without buffering for large files). shutil.copy2 is the
+    fallback, and the only path elsewhere.
+    
+    Parameters:
+        src_path: The file to copy.
+        dst_path: The destination file path.
+    """
+    # shutil pulls in the compression modules, so it is only imported once a backup runs.
+    import shutil
+
+    if sys.platform != "win32":
+        shutil.copy2(src_path, dst_path)
+        return
+    src_root = _volume_root(src_path)
+    if src_root is not None and src_root == _volume_root(os.path.dirname(dst_path)):
+        cluster_size = _volume_clone_info(src_root)
+        if cluster_size:
+            try:
+                _clone_file(src_path, dst_path, cluster_size)
+                return
+            except OSError:
+                pass
+    flags = _COPY_FILE_NO_BUFFERING if os.path.getsize(src_path) > _UNBUFFERED_COPY_MIN_SIZE else 0
+    if _CopyFileExW(src_path, dst_path, None, None, None, flags):
+        return
+    shutil.copy2(src_path, dst_path)
+
+
+class VirtualListbox(tk.Frame):
+    """
+    A scrollable Listbox that only holds the rows currently in view.
+    
+    The full list of strings stays in Python and scrolling re-renders the visible slice,
+    so the widget's size and scroll cost do not depend on the number of items. Selections
+    are tracked by item index rather than by Listbox row.
+    """
+
+    def __init__(self, parent: tk.Misc, items: Iterable[str] = (), selectmode: str = tk.BROWSE,
+                 height: int = 10, **kwargs) -> None:
+        """
+        Create the Listbox and its scrollbar inside a new frame.
+        
+        Parameters:
+            parent: The parent widget.
+            items: The initial items.
+            selectmode: The Listbox selection mode.
+            height: The initial number of visible rows.
+            **kwargs: Options passed on to the frame.
+        """
+        super().__init__(parent, **kwargs)
+        self.items: list[str] = list(items)
+        self.selected: set[int] = set()
+        self.offset = 0
+        self.visible_rows = height
+        self.selectmode = selectmode
+        self.listbox = tk.Listbox(self, selectmode=selectmode, height=height,
+                                  exportselection=False, activestyle="none")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.listbox.pack(side="left", fill="both", expand=True)
+        # Tk lays out each Listbox line as the font's linespace plus the selection border.
+        font = tkfont.Font(font=self.listbox.cget("font"))
+        self._line_height = (font.metrics("linespace") + 1
+                             + 2 * int(self.listbox.cget("selectborderwidth")))
+        self.listbox.bind("<Configure>", self._on_configure)
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
+        self.listbox.bind("<MouseWheel>", self._on_wheel)
+        self.listbox.bind("<Button-4>", self._on_wheel)
+        self.listbox.bind("<Button-5>", self._on_wheel)
+        self._render()
+
+    def set_items(self, items: Iterable[str]) -> None:
+        """
+        Replace every item, clearing the selection and scrolling back to the top.
+        
+        Parameters:
+            items: The new items.
+        """
+        self.items = list(items)
+        self.selected.clear()
+        self.offset = 0
+        self._render()
+
+    def append(self, item: str) -> None:
+        """
+        Add an item at the end of the list.
+        
+        Parameters:
+            item: The item to add.
+        """
+        self.items.append(item)
+        if len(self.items) <= self.offset + self.visible_rows:
+            self.listbox.insert(tk.END, item)
+        self._update_scrollbar()
+
+    def delete(self, index: int) -> None:
+        """
+        Remove the item at an index, keeping the selection of the remaining items.
+        
+        Parameters:
+            index: The item index to remove.
+        """
+        del self.items[index]
+        self.selected = {i - (i > index) for i in self.selected if i != index}
+        self.scroll_to(self.offset, force=True)
+
+    def curselection(self) -> list[int]:
+        """
+        Return the indices of the selected items, in ascending order.
+        """
+        return sorted(self.selected)
+
+    def get(self, index: int) -> str:
+        """
+        Return the item at an index.
+        """
+        return self.items[index]
+
+    def scroll_to(self, first: int, force: bool = False) -> None:
+        """
+        Show the items starting at the given index.
+        
+        Parameters:
+            first: The index of the first item to show; clamped to the valid range.
+            force: Render even if the first visible item does not change.
+        """
+        first = max(0, min(first, len(self.items) - self.visible_rows))
+        if force or first != self.offset:
+            self.offset = first
+            self._render()
+
+    def _render(self) -> None:
+        """
+        Fill the Listbox with the items in view and restore their selection.
+        """
+        listbox = self.listbox
+        offset = self.offset
+        end = offset + self.visible_rows
+        window = self.items[offset:end]
+        listbox.delete(0, tk.END)
+        if window:
+            listbox.insert(tk.END, *window)
+        for index in self.selected:
+            if offset <= index < end:
+                listbox.selection_set(index - offset)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        """
+        Size the scrollbar slider to the visible part of the list.
+        """
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_scroll(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        """
+        Handle scrollbar commands ("moveto" a fraction, or "scroll" by units or pages).
+        """
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.items)))
+        elif action == "scroll":
+            step = int(amount) * (self.visible_rows if unit == "pages" else 1)
+            self.scroll_to(self.offset + step)
+
+    def _on_wheel(self, event: tk.Event) -> str:
+        """
+        Scroll three rows per mouse wheel notch.
+        """
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        else:
+            step = -3 * (event.delta // 120)
+        self.scroll_to(self.offset + step)
+        # Stop the Listbox's own scrolling, which would shift the rendered rows.
+        return "break"
+
+    def _on_configure(self, event: tk.Event) -> None:
+        """
+        Re-render when a resize changes the number of rows that fit.
+        """
+        rows = max(1, event.height // self._line_height)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.scroll_to(self.offset, force=True)
+
+    def _on_select(self, _event: tk.Event) -> None:
+        """
+        Record selection changes of the visible rows against the item indices.
+        """
+        offset = self.offset
+        rows = self.listbox.curselection()
+        if self.selectmode in (tk.BROWSE, tk.SINGLE):
+            self.selected = {offset + row for row in rows}
+            return
+        rendered = range(offset, offset + self.listbox.size())
+        self.selected.difference_update(rendered)
+        self.selected.update(offset + row for row in rows)
+
+
+def _recompile_skip(settings: dict) -> None:
+    """
+    Precompile the entries of skip_folders, classified as the scanner does.
+    
+    The entries are split by scraper.split_skip_patterns, so every rule is lowercase and
+    must be matched against lowercased paths. Plain names are stored as the frozenset
+    settings["_skip_names"], wildcard patterns are unioned into the regex
+    settings["_skip_regex"] (None when there are none) and absolute folders are stored as
+    settings["_skip_blocked"]. All three must be refreshed whenever skip_folders changes.
+    
+    Parameters:
+        settings: The settings dictionary that holds the skip folder patterns.
+    """
+    names, globs, blocked = split_skip_patterns(settings.get("skip_folders", []))
+    settings["_skip_names"] = names
+    settings["_skip_regex"] = re.compile(
+        "|".join(f"(?:{fnmatch.translate(g)})" for g in globs)
+    ) if globs else None
+    settings["_skip_blocked"] = blocked
 
 
 def open_settings_menu(root: tk.Tk, settings: dict) -> None:
@@ -28,23 +421,22 @@ def open_settings_menu(root: tk.Tk, settings: dict) -> None:
 
     # Populate user_accounts only if not already set.
     if "user_accounts" not in settings:
-        ignore_users = {"public", "default", "default user", "all users"}
         user_dirs = []
-        with contextlib.suppress(Exception):
-            for entry in os.listdir("C:\\Users"):
-                if entry.lower() not in ignore_users:
-                    user_dirs.append(entry)
-        settings["user_accounts"] = {}
-        for user in sorted(user_dirs):
-            var = tk.BooleanVar(value=True)
-            chk = tk.Checkbutton(user_frame, text=user, variable=var)
-            chk.pack(anchor="w", padx=10, pady=2)
-            settings["user_accounts"][user] = var
-    else:
-        # Recreate checkbuttons with existing variables.
-        for user, var in settings["user_accounts"].items():
-            chk = tk.Checkbutton(user_frame, text=user, variable=var)
-            chk.pack(anchor="w", padx=10, pady=2)
+        try:
+            # Only real folders are offered; junk like desktop.ini is skipped.
+            with os.scandir("C:\\Users") as it:
+                user_dirs = [
+                    e.name for e in it
+                    if e.is_dir(follow_symlinks=False) and e.name.lower() not in _IGNORED_USER_DIRS
+                ]
+        except OSError:
+            pass
+        settings["user_accounts"] = {user: tk.BooleanVar(value=True) for user in sorted(user_dirs)}
+
+    # Build one checkbutton per account, new or existing, in a single grid pass.
+    for row, (user, var) in enumerate(settings["user_accounts"].items()):
+        tk.Checkbutton(user_frame, text=user, variable=var).grid(
+            row=row, column=0, sticky="w", padx=10, pady=2)
 
     tk.Label(settings_win, text="Folder names to skip:").pack(pady=5)
     # Initialize skip_folders as a list if not set.
@@ -86,27 +478,28 @@ def create_skip_folders_frame(parent: tk.Misc, settings: dict) -> None:
         pattern = new_skip_var.get().strip()
         if pattern and pattern not in settings["skip_folders"]:
             settings["skip_folders"].append(pattern)
-            skip_listbox.insert(tk.END, pattern)
+            _recompile_skip(settings)
+            skip_listbox.append(pattern)
             new_skip_var.set("")
 
     tk.Button(skip_frame, text="Add", command=add_skip).grid(row=0, column=1, padx=5)
 
-    skip_listbox = tk.Listbox(skip_frame, height=4)
+    # "Block Folders from Search" can add many full paths, so only the visible rows are rendered.
+    skip_listbox = VirtualListbox(skip_frame, settings["skip_folders"], height=4)
     skip_listbox.grid(row=1, column=0, columnspan=2, sticky="ew", pady=5)
-    for pattern in settings["skip_folders"]:
-        skip_listbox.insert(tk.END, pattern)
 
     def remove_skip() -> None:
         """
         Remove the selected folder pattern(s) from the skip list.
         """
-        sel = list(skip_listbox.curselection())
-        if sel:
-            for index in sorted(sel, reverse=True):
-                del settings["skip_folders"][index]
-            skip_listbox.delete(0, tk.END)
-            for pattern in settings["skip_folders"]:
-                skip_listbox.insert(tk.END, pattern)
+        sel = skip_listbox.curselection()
+        if not sel:
+            return
+        # Delete from the end so the remaining indices stay valid.
+        for index in sorted(sel, reverse=True):
+            del settings["skip_folders"][index]
+            skip_listbox.delete(index)
+        _recompile_skip(settings)
 
     tk.Button(skip_frame, text="Remove Selected", command=remove_skip).grid(
         row=2, column=0, columnspan=2, pady=5)
@@ -125,52 +518,59 @@ def open_block_folders_window(root: tk.Tk, settings: dict) -> None:
     block_win.geometry("350x300")
     tk.Label(block_win, text="Select folder(s) to block:").pack(pady=5)
 
-    folders_listbox = tk.Listbox(block_win, selectmode=tk.MULTIPLE, height=10)
+    # Only the rows in view are held by the widget, however many folders are indexed.
+    folders_listbox = VirtualListbox(block_win, selectmode=tk.MULTIPLE, height=10)
     folders_listbox.pack(padx=10, pady=5, fill="both", expand=True)
 
-    def is_subblocked(candidate: str, blocked_list: list[str]) -> bool:
+    indexed = settings.get("indexed_folders", [])
+    abspath = os.path.abspath
+    sep = os.path.sep
+    if "_skip_names" not in settings:
+        _recompile_skip(settings)
+    # Blocked absolute folders, lowercased with a trailing separator, sorted, and with any
+    # folder inside another blocked folder dropped. A candidate is then blocked exactly when
+    # its sorted predecessor in this list is a prefix of it.
+    abs_prefixes = []
+    for prefix in sorted(abspath(b).rstrip(sep) + sep for b in settings["_skip_blocked"]):
+        if not abs_prefixes or not prefix.startswith(abs_prefixes[-1]):
+            abs_prefixes.append(prefix)
+    skip_names = settings["_skip_names"]
+    skip_regex = settings["_skip_regex"]
+    skip_match = skip_regex.match if skip_regex is not None else None
+
+    # Normalize every indexed folder once: (folder, lowercased absolute path with a trailing
+    # separator, lowercased folder components). abspath already normalizes the path, so it is
+    # split directly. Like the scanner, names and globs never match the drive component.
+    norm_indexed = []
+    for f in indexed:
+        f_lower = abspath(f).lower()
+        norm_indexed.append((f, f_lower.rstrip(sep) + sep, f_lower.split(sep)[1:]))
+
+    def is_subblocked(candidate_key: str, parts: list[str]) -> bool:
         """
         Determine if a candidate folder should be considered blocked.
         
         Parameters:
-            candidate: The absolute path of the candidate folder.
-            blocked_list: A list of blocked folder patterns or absolute paths.
+            candidate_key: The lowercased absolute path of the candidate folder, ending
+                with a separator.
+            parts: The lowercased folder components of the candidate's absolute path.
         
         Returns:
             True if the candidate matches any blocked pattern; False otherwise.
         """
-        candidate_abs = os.path.abspath(candidate)
-        for b in blocked_list:
-            if os.path.isabs(b):
-                with contextlib.suppress(Exception):
-                    b_abs = os.path.abspath(b)
-                    if candidate_abs == b_abs or candidate_abs.startswith(b_abs + os.path.sep):
-                        return True
-            else:
-                parts = os.path.normpath(candidate_abs).split(os.path.sep)
-                for part in parts:
-                    if fnmatch.fnmatchcase(part, b):
-                        return True
+        if abs_prefixes:
+            i = bisect.bisect_right(abs_prefixes, candidate_key)
+            if i and candidate_key.startswith(abs_prefixes[i - 1]):
+                return True
+        if skip_names and not skip_names.isdisjoint(parts):
+            return True
+        if skip_match is not None:
+            return any(skip_match(part) for part in parts)
         return False
 
-    indexed = settings.get("indexed_folders", [])
-    blocked = settings.get("skip_folders", [])
-    filtered_folders = [f for f in indexed if not is_subblocked(f, blocked)]
-
-    # Lazy batch loading of folders into the listbox.
-    filtered_iter = iter(sorted(filtered_folders))
-    batch_size = 50
-
-    def load_batch() -> None:
-        count = 0
-        for folder in filtered_iter:
-            folders_listbox.insert(tk.END, folder)
-            count += 1
-            if count >= batch_size:
-                block_win.after(10, load_batch)
-                return
+    filtered_folders = [f for f, lower, parts in norm_indexed if not is_subblocked(lower, parts)]
 
-    load_batch()
+    folders_listbox.set_items(sorted(filtered_folders))
 
     def block_selected() -> None:
         """
@@ -181,39 +581,69 @@ def open_block_folders_window(root: tk.Tk, settings: dict) -> None:
             folder = folders_listbox.get(idx)
             if folder not in settings.get("skip_folders", []):
                 settings["skip_folders"].append(folder)
+        _recompile_skip(settings)
         block_win.destroy()
 
     tk.Button(block_win, text="Block Selected", command=block_selected).pack(pady=5)
 
 
+def _settings_from_plain(data: dict) -> dict:
+    """
+    Build a settings dictionary, with fresh Tk variables, from parsed settings.json data.
+    
+    Parameters:
+        data: The parsed JSON document.
+    
+    Returns:
+        A dictionary containing settings with appropriate types.
+    """
+    result = {
+        "ignore_downloads": tk.BooleanVar(
+            value=data.get("ignore_downloads", False)
+        )
+    }
+    # Copy the list so edits never reach the cached document.
+    result["skip_folders"] = list(data.get("skip_folders", []))
+    _recompile_skip(result)
+    # user_accounts will be populated later by open_settings_menu.
+    return result
+
+
 def load_settings() -> dict:
     """
     Load settings from a JSON file (if it exists) and return a settings dictionary.
     
+    The parsed file is cached and only read again when its modification time or size
+    changes. Tk variables are always created anew, since they cannot be shared.
+    
     Returns:
         A dictionary containing settings with appropriate types.
     """
-    if os.path.exists("settings.json"):
-        try:
-            with open("settings.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-            result = {
-                "ignore_downloads": tk.BooleanVar(
-                    value=data.get("ignore_downloads", False)
-                )
-            }
-            result["skip_folders"] = data.get("skip_folders", [])
-            # user_accounts will be populated later by open_settings_menu.
-            return result
-        except Exception:
-            return {}
-    return {}
+    try:
+        st = os.stat("settings.json")
+    except OSError:
+        return {}
+    key = (st.st_mtime_ns, st.st_size)
+    try:
+        data = _SETTINGS_CACHE.get(key)
+        if data is None:
+            with open("settings.json", "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            _SETTINGS_CACHE.clear()
+            _SETTINGS_CACHE[key] = data
+        return _settings_from_plain(data)
+    except Exception:
+        return {}
 
 
 def save_settings(settings: dict) -> None:
     """
     Save the current settings to a JSON file.
     
+    The document is written to a temporary file that then replaces settings.json, so an
+    interrupted save never leaves a truncated file behind.
+    
     Parameters:
         settings: A dictionary of settings which may include tk.BooleanVar objects.
     """
@@ -221,18 +651,55 @@ def save_settings(settings: dict) -> None:
     if "ignore_downloads" in settings:
         plain["ignore_downloads"] = settings["ignore_downloads"].get()
     plain["skip_folders"] = settings.get("skip_folders", [])
-    with open("settings.json", "w", encoding="utf-8") as f:
-        json.dump(plain, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(plain, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(plain, indent=2) + "\n").encode("utf-8")
+    tmp_path = "settings.json.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, "settings.json")
 
 
-def backup_files(root: tk.Misc, files_to_backup: list[dict]) -> None:
+def _unique_destination(dst_path: str, taken: set[str]) -> str:
+    """
+    Return a destination path that no earlier file of the backup is copied to.
+    
+    Backup paths are compared case-insensitively, as on NTFS. A colliding path gets a
+    " (n)" suffix before its extension, so two files with the same name are both kept
+    and never copied onto the same target concurrently.
+    
+    Parameters:
+        dst_path: The preferred destination path.
+        taken: The lowercased destination paths already assigned; the result is added to it.
+    
+    Returns:
+        dst_path itself, or the first free suffixed variant of it.
+    """
+    key = dst_path.lower()
+    if key in taken:
+        dot = dst_path.rfind(".")
+        if dot <= dst_path.rfind(os.sep):
+            dot = len(dst_path)
+        base, ext = dst_path[:dot], dst_path[dot:]
+        n = 2
+        while (key := f"{base} ({n}){ext}".lower()) in taken:
+            n += 1
+        dst_path = f"{base} ({n}){ext}"
+    taken.add(key)
+    return dst_path
+
+
+def backup_files(root: tk.Misc, files_to_backup: list[tuple[str, str]]) -> None:
     """
     Open a window to select backup style and then start the backup process.
     
     Parameters:
         root: The main Tkinter window.
-        files_to_backup: A list of dictionaries representing files to back up.
+        files_to_backup: A list of (path, type) tuples representing files to back up.
     """
+    from tkinter import messagebox
+
     if not files_to_backup:
         messagebox.showwarning("No Files", "No files available to backup.")
         return
@@ -278,15 +745,22 @@ def format_elapsed_time(seconds: float) -> str:
     return f"{hours}h {minutes}m {seconds:.1f}s"
 
 
-def perform_backup(root: tk.Misc, files_to_backup: list[dict], use_categories: bool) -> None:
+def perform_backup(root: tk.Misc, files_to_backup: list[tuple[str, str]], use_categories: bool) -> None:
     """
     Perform the backup operation of copying files to a backup directory.
     
+    Files are copied by a pool of BACKUP_WORKERS threads, driven from a background
+    thread that reports progress through a queue. The Tk thread drains the queue every
+    BACKUP_POLL_MS milliseconds, so no Tk call is made from the copy threads.
+    
     Parameters:
         root: The parent Tkinter widget.
-        files_to_backup: A list of dictionaries representing the files to back up.
+        files_to_backup: A list of (path, type) tuples representing the files to back up.
         use_categories: If True, files are sorted into subdirectories based on type.
     """
+    from datetime import datetime
+    from tkinter import messagebox
+
     start_time = time.time()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)),
@@ -306,81 +780,142 @@ def perform_backup(root: tk.Misc, files_to_backup: list[dict], use_categories: b
     progress.pack(pady=20)
     status_label = tk.Label(progress_win, text="Preparing backup...")
     status_label.pack(pady=5)
-    time_label = tk.Label(progress_win, text="Elapsed: 0s")
-    time_label.pack(pady=5)
-
-    def update_elapsed() -> None:
-        """
-        Update the elapsed time label every second.
-        """
-        if progress_win.winfo_exists():
-            elapsed = time.time() - start_time
-            time_label.config(text=f"Elapsed: {format_elapsed_time(elapsed)}")
-            progress_win.after(1000, update_elapsed)
-
-    update_elapsed()
+    elapsed_var = tk.StringVar(progress_win, value="Elapsed: 0s")
+    tk.Label(progress_win, textvariable=elapsed_var).pack(pady=5)
 
     total_files = len(files_to_backup)
+    # Copied-file counts from the copy thread, followed by a None sentinel once it is done.
+    progress_queue = queue.SimpleQueue()
     copied = 0
+    shown_percent = 0
+    shown_seconds = 0
+
+    def drain() -> None:
+        """
+        Apply every progress report queued since the last poll with a single widget update,
+        and refresh the elapsed time once per second.
+        """
+        nonlocal copied, shown_percent, shown_seconds
+        done = False
+        latest = copied
+        try:
+            while True:
+                item = progress_queue.get_nowait()
+                if item is None:
+                    done = True
+                    break
+                latest = item
+        except queue.Empty:
+            pass
+        if latest != copied:
+            copied = latest
+            if progress_win.winfo_exists():
+                # The bar only moves in whole percents, so skip the Tcl call until it changes.
+                percent = copied * 100 // total_files
+                if percent != shown_percent:
+                    progress['value'] = percent
+                    shown_percent = percent
+                status_label.config(text=f"Copying: {copied}/{total_files}")
+        elapsed = time.time() - start_time
+        if int(elapsed) != shown_seconds and progress_win.winfo_exists():
+            shown_seconds = int(elapsed)
+            elapsed_var.set(f"Elapsed: {format_elapsed_time(elapsed)}")
+        if done:
+            finish(copied)
+        else:
+            # Poll through root so the backup still completes if the progress window is closed.
+            root.after(BACKUP_POLL_MS, drain)
+
+    def finish(copied: int) -> None:
+        """
+        Close the progress window and report the result.
+        """
+        elapsed = time.time() - start_time
+        progress_win.destroy()
+        messagebox.showinfo("Backup Complete",
+                            f"Successfully backed up {copied} files to {backup_dir}\n"
+                            f"Time taken: {format_elapsed_time(elapsed)}")
 
-    for file_info in files_to_backup:
-        src_path = file_info["path"]
+    def copy_files() -> None:
+        """
+        Copy every file, reporting the running count through progress_queue.
+        """
+        # The sentinel is always sent, so the progress window closes even if setup fails.
         try:
-            if use_categories:
-                file_lower = src_path.lower()
-                if file_info["type"] == "full":
-                    if file_lower.endswith(('.txt', '.asc')):
-                        category_dir = "text_files"
-                    elif file_lower.endswith(('.png', '.jpg', '.jpeg', '.gif')):
-                        category_dir = "images"
-                    elif file_lower.endswith(('.mp4', '.avi', '.mkv')):
-                        category_dir = "videos"
-                    elif file_lower.endswith('.mp3'):
-                        category_dir = "music"
+            pairs = []
+            dst_dirs = set()
+            taken = set()
+            sep = os.sep
+            backup_prefix = backup_dir + sep
+            # Bind the per-file lookups to locals once for the loop below.
+            add_pair = pairs.append
+            add_dir = dst_dirs.add
+            ext_category = _EXT_CATEGORY.get
+            type_category = _TYPE_CATEGORY.get
+            splitdrive = os.path.splitdrive
+            unique_destination = _unique_destination
+            for src_path, file_type in files_to_backup:
+                if use_categories:
+                    if file_type == "full":
+                        # Slice out only the extension; a dot before the last separator
+                        # belongs to a folder name, not the file.
+                        dot = src_path.rfind(".")
+                        ext = src_path[dot:].lower() if dot > src_path.rfind(sep) else ""
+                        category_dir = ext_category(ext, "other")
                     else:
-                        category_dir = "other"
+                        category_dir = type_category(file_type, "other")
+                    add_dir(backup_prefix + category_dir)
+                    dst_path = f"{backup_prefix}{category_dir}{sep}{src_path.rpartition(sep)[2]}"
                 else:
-                    category_dir = {
-                        "text": "text_files",
-                        "image": "images",
-                        "video": "videos"
-                    }.get(file_info["type"], "other")
-                dst_path = os.path.join(backup_dir, category_dir, os.path.basename(src_path))
-            else:
-                rel_path = os.path.splitdrive(src_path)[1].lstrip(os.sep)
-                dst_path = os.path.join(backup_dir, rel_path)
-
-            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-            shutil.copy2(src_path, dst_path)
-
-            copied += 1
-            progress['value'] = (copied / total_files) * 100
-            status_label.config(text=f"Copying: {copied}/{total_files}")
-            progress_win.update()
-        except Exception as e:
-            print(f"Error copying {src_path}: {e}")
-
-    elapsed = time.time() - start_time
-    progress_win.destroy()
-    messagebox.showinfo("Backup Complete",
-                        f"Successfully backed up {copied} files to {backup_dir}\n"
-                        f"Time taken: {format_elapsed_time(elapsed)}")
-
-
-def create_ui() -> tuple[tk.Tk, ttk.Progressbar, tk.Label, tk.Label, tk.Label,
+                    rel_path = splitdrive(src_path)[1].lstrip(sep)
+                    dst_path = backup_prefix + rel_path
+                    add_dir(dst_path.rpartition(sep)[0])
+                # Files with the same name (or the same path on another drive) must not be
+                # copied onto one target by two workers at once.
+                add_pair((src_path, unique_destination(dst_path, taken)))
+
+            # Create each destination directory once, before any copy starts.
+            for dst_dir in dst_dirs:
+                try:
+                    os.makedirs(dst_dir, exist_ok=True)
+                except OSError as e:
+                    print(f"Error creating {dst_dir}: {e}")
+
+            done_count = 0
+            report = progress_queue.put
+            with ThreadPoolExecutor(max_workers=BACKUP_WORKERS) as executor:
+                submit = executor.submit
+                futures = {submit(_fast_copy, src, dst): src for src, dst in pairs}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Error copying {futures[future]}: {e}")
+                        continue
+                    done_count += 1
+                    report(done_count)
+        finally:
+            progress_queue.put(None)
+
+    threading.Thread(target=copy_files, daemon=True).start()
+    root.after(BACKUP_POLL_MS, drain)
+
+
+def create_ui() -> tuple[tk.Tk, ttk.Progressbar, tk.StringVar, tk.StringVar, tk.StringVar,
                            dict, tk.Button, tk.Button, tk.Button, tk.Button, tk.Button]:
     """
     Create and return the main user interface components.
     
     The UI includes:
-      - A progress bar and status labels.
+      - A progress bar and status labels, each bound to a StringVar that is updated
+        instead of reconfiguring the label.
       - Scan buttons for text files, image files, video files, and a full scan.
       - A settings button to adjust preferences.
       - A backup button (initially disabled) to back up found files.
     
     Returns:
         A tuple containing:
-          root, progress, status_label, total_files_label, current_file_label,
+          root, progress, status_var, total_files_var, current_file_var,
           settings, btn_text, btn_image, btn_video, btn_full, backup_btn.
     """
     root = tk.Tk()
@@ -390,12 +925,12 @@ def create_ui() -> tuple[tk.Tk, ttk.Progressbar, tk.Label, tk.Label, tk.Label,
 
     progress = ttk.Progressbar(root, orient="horizontal", length=400, mode="determinate")
     progress.pack(pady=10)
-    status_label = tk.Label(root, text="Status: Ready")
-    status_label.pack(pady=5)
-    total_files_label = tk.Label(root, text="Total files found: 0")
-    total_files_label.pack(pady=5)
-    current_file_label = tk.Label(root, text="Current file: None")
-    current_file_label.pack(pady=5)
+    status_var = tk.StringVar(value="Status: Ready")
+    tk.Label(root, textvariable=status_var).pack(pady=5)
+    total_files_var = tk.StringVar(value="Total files found: 0")
+    tk.Label(root, textvariable=total_files_var).pack(pady=5)
+    current_file_var = tk.StringVar(value="Current file: None")
+    tk.Label(root, textvariable=current_file_var).pack(pady=5)
 
     btn_frame = tk.Frame(root)
     btn_frame.pack(pady=15)
@@ -414,16 +949,16 @@ def create_ui() -> tuple[tk.Tk, ttk.Progressbar, tk.Label, tk.Label, tk.Label,
     backup_btn = tk.Button(root, text="Backup Files", state="disabled")
     backup_btn.pack(pady=5)
 
-    return root, progress, status_label, total_files_label, current_file_label, settings, btn_text, btn_image, btn_video, btn_full, backup_btn
+    return root, progress, status_var, total_files_var, current_file_var, settings, btn_text, btn_image, btn_video, btn_full, backup_btn
 
 
-def enable_backup_button(backup_btn: tk.Button, files: list[dict]) -> None:
+def enable_backup_button(backup_btn: tk.Button, files: list[tuple[str, str]]) -> None:
     """
     Enable the backup button and bind it to the backup_files function.
     
     Parameters:
         backup_btn: The Tkinter button to enable.
-        files: A list of dictionaries representing the files to back up.
+        files: A list of (path, type) tuples representing the files to back up.
     """
     backup_btn.config(
         state="normal",
@@ -431,37 +966,46 @@ def enable_backup_button(backup_btn: tk.Button, files: list[dict]) -> None:
     )
 
 
-def update_total_files(total_files_label: tk.Label, count: int) -> None:
+def update_total_files(total_files_var: tk.StringVar, count: int) -> None:
     """
     Update the total files label with the provided count.
     
     Parameters:
-        total_files_label: The label to update.
+        total_files_var: The text variable of the label to update.
         count: The total number of files found.
     """
-    total_files_label.config(text=f"Total files found: {count}")
+    total_files_var.set(f"Total files found: {count}")
 
 
-def update_current_file(current_file_label: tk.Label, file_name: str) -> None:
+def update_current_file(current_file_var: tk.StringVar, file_name: str, force: bool = False) -> None:
     """
     Update the current file label with the name of the file being processed.
     
+    Updates arriving within CURRENT_FILE_INTERVAL seconds of the last one shown are
+    dropped, since a path that changes faster than that cannot be read anyway.
+    
     Parameters:
-        current_file_label: The label to update.
+        current_file_var: The text variable of the label to update.
         file_name: The name of the current file.
+        force: Show the name even if the last update was too recent.
     """
-    current_file_label.config(text=f"Current file: {file_name}")
+    global _current_file_shown_at
+    now = time.monotonic()
+    if not force and now - _current_file_shown_at < CURRENT_FILE_INTERVAL:
+        return
+    _current_file_shown_at = now
+    current_file_var.set(f"Current file: {file_name}")
 
 
-def update_status(status_label: tk.Label, message: str) -> None:
+def update_status(status_var: tk.StringVar, message: str) -> None:
     """
     Update the status label with a new message.
     
     Parameters:
-        status_label: The label to update.
+        status_var: The text variable of the label to update.
         message: The new status message.
     """
-    status_label.config(text=message)
+    status_var.set(message)
 
 
 def update_progress(progress: ttk.Progressbar, value: int) -> None: